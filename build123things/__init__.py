@@ -15,21 +15,114 @@ Perhaps consider this module as a collection of CONVENTIONS of working with the
 
 from ctypes import ArgumentError
 from abc import ABC, ABCMeta, abstractmethod
-from typing import NoReturn, Set, TypeAlias, Union, final, Any, Callable, Tuple, Generator
+from typing import NoReturn, Set, TypeAlias, Union, final, Any, Callable, Tuple, Generator, get_args
 import build123d as bd
 import numpy as np
-from .misc import memoize, random_tmp_fname
 import colored
 import copy
+import functools
 import inspect
 from .materials import Material
-import os
-from stl import mesh
+import sys
+import weakref
 from warnings import warn
 
+_MISSING = object()
+""" Sentinel for dictionary lookups where `None` is a legitimate value. """
+
+_INIT:str = "__init__"
+_SETITEM:str = "__setitem__"
+""" Names of the only frames from which `Thing` attributes may be assigned. """
+
 MOUNTING_LOCATION:bd.Location = bd.Location((0,0,0),(180,0,90))
 
-DEBUG:Set[str] = set()
+def _compose(*locations:bd.Location) -> bd.Location:
+    """ The product of the given locations.
+    Composes the underlying `TopLoc_Location`s directly, bypassing the type dispatch in `bd.Location.__mul__` and `bd.Location.__init__`, as this runs on every step of every walk through an assembly. """
+    wrapped = locations[0].wrapped
+    for location in locations[1:]:
+        wrapped = wrapped * location.wrapped
+    ret = bd.Location.__new__(bd.Location)
+    ret.wrapped = wrapped
+    return ret
+
+def _location_matrices(locations:list[bd.Location]) -> np.ndarray:
+    """ The homogeneous matrices of the given locations stacked into shape `(n, 4, 4)`, translations in millimeters. """
+    ret = np.zeros((len(locations), 4, 4))
+    ret[:, 3, 3] = 1
+    for i, location in enumerate(locations):
+        trsf = location.wrapped.Transformation()
+        for r in range(3):
+            for c in range(4):
+                ret[i, r, c] = trsf.Value(r + 1, c + 1)
+    return ret
+
+_MOUNTING_MATRIX:np.ndarray = _location_matrices([MOUNTING_LOCATION])[0]
+""" `MOUNTING_LOCATION` as a homogeneous matrix. """
+
+_LOC_VEC:tuple[type,...] = (bd.Location, bd.Vector)
+""" Zero-dimensional reference geometries. """
+
+_DEBUG_GETATTR:bool = False
+""" Cached `"Thing.__getattr__" in DEBUG`, so the hot attribute access path tests a single boolean. """
+
+_DEBUG_SETATTR:bool = False
+""" Cached `"Thing.__setattr__" in DEBUG`, as above. """
+
+_CYAN:str = colored.Fore.cyan
+_GREEN:str = colored.Fore.green
+_RED:str = colored.Fore.red
+_YELLOW:str = colored.Fore.yellow
+_GREY:str = colored.Fore.rgb(100,100,100)
+_RESET:str = colored.Style.reset
+""" Colors of the debug prints on the hot paths, resolved once. """
+
+_STR_HEAD_FMT:str = "Thing " + _GREEN + "%r" + _RESET + "#" + _YELLOW + "%d" + _RESET
+_STR_LINE_FMT:str = " - " + _CYAN + "%s" + _RESET + " is " + _GREEN + "%r" + _YELLOW + "#%d" + _RESET + _RESET
+""" Line templates of `Thing.__str__`, assembled once. """
+
+def _print_debug_caller(depth:int=2) -> None:
+    """ Prints where the debugged method was called from. Only the single needed frame is inspected, not the whole stack. """
+    info = inspect.getframeinfo(sys._getframe(depth))
+    try:
+        code_context = info.code_context[0].strip()[:100] # type: ignore
+    except:
+        code_context = "<code context not available>"
+    print(f" {_GREY}\\_> ...{info.filename[-20:]}:{info.lineno}   {code_context}{_RESET}")
+
+def _resyncing(method:Callable) -> Callable:
+    """ Wraps a mutating method of `set` so that `DebugSet` resyncs the debug flags afterwards. """
+    @functools.wraps(method)
+    def wrapped(self:"DebugSet", *args):
+        ret = method(self, *args)
+        self._sync()
+        return ret
+    return wrapped
+
+class DebugSet (set):
+    """ A set of method names with debugging enabled which keeps the module-level debug flags in sync when mutated. """
+
+    def _sync(self) -> None:
+        global _DEBUG_GETATTR, _DEBUG_SETATTR
+        _DEBUG_GETATTR = "Thing.__getattr__" in self
+        _DEBUG_SETATTR = "Thing.__setattr__" in self
+
+    # NOTE: Every mutating method of set, the in-place operators included, has to resync.
+    add = _resyncing(set.add)
+    discard = _resyncing(set.discard)
+    remove = _resyncing(set.remove)
+    pop = _resyncing(set.pop)
+    clear = _resyncing(set.clear)
+    update = _resyncing(set.update)
+    difference_update = _resyncing(set.difference_update)
+    intersection_update = _resyncing(set.intersection_update)
+    symmetric_difference_update = _resyncing(set.symmetric_difference_update)
+    __ior__ = _resyncing(set.__ior__)
+    __isub__ = _resyncing(set.__isub__)
+    __iand__ = _resyncing(set.__iand__)
+    __ixor__ = _resyncing(set.__ixor__)
+
+DEBUG:Set[str] = DebugSet()
 "List all methods which are supposed to have debugging enabled."
 #DEBUG.add("Thing.__setattr__")
 #DEBUG.add("Thing.__init__")
@@ -39,20 +132,119 @@ DEBUG:Set[str] = set()
 #DEBUG.add("MountPoint.__init__")
 
 
+def _mass_properties(triangles:np.ndarray, densities:np.ndarray|None=None) -> Tuple[float, np.ndarray, np.ndarray]:
+    """ Volume, center of gravity and matrix of inertia (w.r.t. the center of gravity) of a closed triangle mesh given as an array of shape `(n_triangles, 3, 3)`.
+    If per-triangle `densities` are given (the mesh may then consist of several closed meshes), mass is returned instead of the volume and the inertia is weighted accordingly.
+    Summed over the triangles in closed form, see https://www.geometrictools.com/Documentation/PolyhedralMassProperties.pdf """
+    # NOTE: Laid out as coordinate-major rows of length n_triangles, so that each elementwise operation below runs over contiguous memory.
+    w0, w1, w2 = np.ascontiguousarray(triangles.transpose(1, 2, 0))
+    d = np.cross(w1 - w0, w2 - w0, axis=0)
+    # NOTE: The net area is compared to the total one, an absolute tolerance would let through open meshes of small parts.
+    if not np.allclose(d.sum(axis=1), 0, atol=1e-9 * np.abs(d).sum()):
+        warn("The mesh is not closed, the mass properties are not reliable.")
+    if densities is not None:
+        d *= densities
+    temp0 = w0 + w1
+    f1 = temp0 + w2
+    temp1 = w0 * w0
+    temp2 = temp1 + w1 * temp0
+    f2 = temp2 + w2 * f1
+    f3 = w0 * temp1 + w1 * temp2 + w2 * f2
+    g0 = f2 + w0 * (f1 + w0)
+    g1 = f2 + w1 * (f1 + w1)
+    g2 = f2 + w2 * (f1 + w2)
+    # Products along x*y, y*z and z*x, respectively.
+    g_cross = w0[[1,2,0]] * g0 + w1[[1,2,0]] * g1 + w2[[1,2,0]] * g2
+    volume = d[0] @ f1[0] / 6
+    first = np.einsum("ij,ij->i", d, f2) / 24
+    second = np.einsum("ij,ij->i", d, f3) / 60
+    products = np.einsum("ij,ij->i", d, g_cross) / 120
+    cog = first / volume
+    inertia = np.empty((3,3))
+    inertia[0,0] = second[1] + second[2] - volume * (cog[1]**2 + cog[2]**2)
+    inertia[1,1] = second[2] + second[0] - volume * (cog[2]**2 + cog[0]**2)
+    inertia[2,2] = second[0] + second[1] - volume * (cog[0]**2 + cog[1]**2)
+    inertia[0,1] = inertia[1,0] = -(products[0] - volume * cog[0] * cog[1])
+    inertia[1,2] = inertia[2,1] = -(products[1] - volume * cog[1] * cog[2])
+    inertia[0,2] = inertia[2,0] = -(products[2] - volume * cog[2] * cog[0])
+    return volume, cog, inertia
+
+
+_JOINT_STATE_VERSION:int = 0
+""" Incremented whenever any joint is attached or set, invalidating the cached properties which depend on the state of an assembly. """
+
+def _copy_bound_box(bb:bd.BoundBox) -> bd.BoundBox:
+    """ An independent copy of the bounding box; `BoundBox` wraps a mutable OCCT box. """
+    box = type(bb.wrapped)()
+    box.Add(bb.wrapped)
+    return bd.BoundBox(box)
+
+def _thing_cache(thing:"Thing") -> dict[Any,Any]:
+    """ The cache of computed properties of the given Thing. """
+    cache = _PROPERTY_CACHE.get(thing)
+    if cache is None:
+        cache = _PROPERTY_CACHE[thing] = {}
+    return cache
+
+def _cached_per_thing(method:Callable) -> Callable:
+    """ Memoizes a method of a Thing, which is sound as Things are immutable. Unlike `misc.memoize`, the Thing is not keyed by its textual representation. """
+    name:str = method.__name__
+    signature:inspect.Signature = inspect.signature(method)
+    defaults:Any = _typed_key(tuple(p.default for p in tuple(signature.parameters.values())[1:]))
+    """ The arguments of the plain call, to tell the equivalent explicit calls. """
+    @functools.wraps(method)
+    def cached(self, *args, **kwargs):
+        cache = _thing_cache(self)
+        # NOTE: Calls with default arguments are by far the most common, these are keyed by the bare method name.
+        if args or kwargs:
+            # NOTE: Bound to the signature, so that e.g. `f(False)` and `f(recurse=False)` share the entry of `f()`.
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            values = _typed_key(tuple(bound.arguments.values())[1:])
+            key = name if values == defaults else (name, values)
+        else:
+            key = name
+        ret = cache.get(key, _MISSING)
+        if ret is _MISSING:
+            ret = cache[key] = method(self, *args, **kwargs)
+        return ret
+    return cached
+
+
+def _typed_key(value:Any) -> Any:
+    """ A key of a constructor argument which tells apart equal values of different types, like 1, 1.0 and True; tuples are keyed item by item. """
+    if type(value) is tuple:
+        return tuple(map(_typed_key, value))
+    return (type(value), value)
+
 class ThingMeta (ABCMeta):
     """ Facilitates the parameter capture functionality and the memoization.
 
     The __call__ method is called before even creating any objects of the future Thing instance.
     Hence, we may safely check if an instance with the very same parameters does not already exist.
-    If so, the existing instance is used. (The very generic memoization is used.)
+    If so, the existing instance is used. (Each class keeps its own cache of instances keyed by the arguments.)
 
     If no existing instance exists, a new one is created and automatically fitted with the arguments which were passed there.
     """
 
-    @memoize
     def __call__(cls, *args: Any, **kwds: Any) -> Any:
         """ This intercepts the class instantiation and checks the parameters in the cache. If found, reference to existing instance is returned. """
-        ret = super(ThingMeta, cls).__call__(*args, **kwds)
+        cache:weakref.WeakValueDictionary = cls._instance_cache # type: ignore
+        # NOTE: Keyword arguments are sorted so that their order in the call does not matter.
+        kwitems = sorted(kwds.items())
+        try:
+            key:Any = (_typed_key(args), tuple((k, _typed_key(v)) for k, v in kwitems))
+            ret = cache.get(key)
+        except TypeError:
+            # NOTE: Unhashable arguments fall back to the textual key as used by the generic `memoize`.
+            key = str(args) + str(kwitems)
+            ret = cache.get(key)
+        if ret is None:
+            ret = super(ThingMeta, cls).__call__(*args, **kwds)
+            # NOTE: The Thing is complete now, rebuild its attributes into a compact (non-split) dict.
+            object.__setattr__(ret, "__dict__", dict(ret.__dict__))
+            cache[key] = ret
+            _CALL_ARGUMENTS[ret] = (args, kwds)
         if "ThingMeta.__call__" in DEBUG:
             print(f"The __call__ returned: {ret}")
         return ret
@@ -63,14 +255,17 @@ class ParameterResolver:
     def __init__(self, thing:"Thing") -> None:
         self.thing = thing
         self.__parameters__ = thing.__parameters__
+        self._flat:dict[str,Any] = {}
+        """ All parameters in one namespace; the most derived class takes precedence. """
+        for _, ns in self.__parameters__:
+            for k, v in ns.items():
+                self._flat.setdefault(k, v)
 
     def __getattr__(self, __name:str) -> float:
-        for ns in self.__parameters__:
-            try:
-                return ns[1][__name]
-            except:
-                continue
-        raise ArgumentError(f"Parameter {__name} not known in {self.thing}")
+        __value = self._flat.get(__name, _MISSING)
+        if __value is _MISSING:
+            raise ArgumentError(f"Parameter {__name} not known in {self.thing}")
+        return __value
 
 class MountPoint:
     """ Wraps a location in a `Thing`'s reference frame for the purpose of mounting other `Thing`s via `AbstractJoint`s.
@@ -78,8 +273,11 @@ class MountPoint:
     This is a more explicit, declarative approach to assembly definitions.
     Previously, the attached Thing was unable to know where it is attached to, making further reasoning impossible.
     """
+
+    __slots__ = ("location", "owner", "known_as", "_joint_outbound", "_joints_inbound", "_resolved", "adjust")
+
     def owned(self) -> bool:
-        return self._owner is not None and self._known_as is not None
+        return self.owner is not None and self.known_as is not None
 
     def __init__(self, location:"bd.Location|MountPoint", owner:"Thing|None"=None, known_as:str|None=None) -> None:
         if isinstance(location, MountPoint):
@@ -87,16 +285,16 @@ class MountPoint:
         elif isinstance(location, TransformResolver):
             location = location.location
         assert isinstance(location, bd.Location), str(location) + str(type(location))
-        assert isinstance(owner, Thing|None)
-        assert isinstance(known_as, str|None)
+        assert isinstance(owner, _T_THING_NONE)
+        assert isinstance(known_as, _T_STR_NONE)
         if "MountPoint.__init__" in DEBUG:
             print(f"Thing.__init__ {repr(self)} with {location}")
 
-        self._owner:Thing|None = owner
-        """ A thing instance for which this mount point is defined. """
-        self._known_as:str|None = known_as
-        """ An attribute name in the `self.owner` which leads to `self`. """
-        self._location:bd.Location = location
+        self.owner:Thing|None = owner
+        """ A thing instance for which this mount point is defined. Assigned once, either here or by `Thing.__setattr__`. """
+        self.known_as:str|None = known_as
+        """ An attribute name in the `self.owner` which leads to `self`. Assigned once, either here or by `Thing.__setattr__`. """
+        self.location:bd.Location = location
         """ The numerical definition of the position of this MountPoint in the reference frame of `self.owner`. """
         self._joint_outbound:AbstractJoint|None = None
         """ A mount point is required to host only one outbound joint.
@@ -105,57 +303,12 @@ class MountPoint:
         This might be useful, e.g., for coaxial asemblies."""
         self._joints_inbound:list[AbstractJoint] = []
         """ This mount point may be used to attach the owner to different things. I.e., owner is subassembly of referenced joints.  """
+        self._resolved:dict[AbstractJoint,tuple[int,bd.Location]] = {}
+        """ The transforms towards the attached Things computed by `TransformResolver`, keyed by the joint, together with the joint's state version they were computed with. """
 
         self.adjust:Callable
         """ Mount point  For the purpose of type hinting """
 
-    @property
-    def location(self) -> bd.Location:
-        return self._location
-
-    @location.setter
-    def location(self, value:bd.Location) -> None:
-        assert self._owner is not None, f"The mount point {self} needs to be owned to have a meaning."
-        #assert inspect.stack()[1].function in ("__init__", "__setattr__")
-        assert isinstance(value, bd.Location)
-        self._location:bd.Location = value
-
-    @location.getter
-    def location(self) -> bd.Location:
-        return self._location
-
-    @property
-    def owner(self) -> "Thing":
-        return self._owner # type: ignore
-
-    @owner.setter
-    def owner(self, value:"Thing") -> None:
-        assert isinstance(value, Thing)
-        assert self._owner is None
-        #assert inspect.stack()[1].function in ("__init__", "__setattr__")
-        self._owner:Thing|None = value
-
-    @owner.getter
-    def owner(self) -> "Thing":
-        assert self._owner is not None
-        return self._owner
-
-    @property
-    def known_as(self):
-        return self._owner
-
-    @known_as.setter
-    def known_as(self, value) -> None:
-        assert self._known_as is None
-        #assert inspect.stack()[1].function in ("__init__", "__setattr__")
-        assert isinstance(value, str)
-        self._known_as:str|None = value
-
-    @known_as.getter
-    def known_as(self) -> str:
-        assert self._known_as is not None
-        return self._known_as
-
     def __getattr__(self, __name) -> NoReturn:
         """ Declared for the purpose of LSP - to accept access to this object. """
         raise RuntimeError("This should never happen - the TransformResolver should expose one of the mounts.")
@@ -163,9 +316,12 @@ class MountPoint:
     def __getitem__(self, params):
         """ Shorthand which attaches to the mount point a joint and another mount point. """
         owner, joint_type, other = params
-        assert isinstance(owner, Thing)
-        assert issubclass(joint_type, AbstractJoint)
-        assert isinstance(other, MountPoint|TransformResolver), f"Other {other} is not MountPoint or TransformResolver. It is {type(other)}"
+        if __debug__:
+            # NOTE: The MRO membership avoids the `ABCMeta.__subclasscheck__` machinery; joints are never registered virtually.
+            assert isinstance(owner, Thing)
+            assert type(joint_type) is ABCMeta and AbstractJoint in joint_type.__mro__
+            assert isinstance(other, _T_MP_TR), f"Other {other} is not MountPoint or TransformResolver. It is {type(other)}"
+            assert self.owner is None
         self.owner = owner
         joint_type(self, other)
         return TransformResolver(mount_point=self)
@@ -220,8 +376,17 @@ class Thing (ABC, metaclass=ThingMeta):
     COMPONENT_TYPE:TypeAlias = Union[bd.Sketch, bd.Part, bd.Compound, bd.Curve, bd.Location]
     """ List of all types which may comprise a Thing. """
 
-    list_of_all_existing_things:list["Thing"] = []
-    """ Each Thing gets listed here, e.g., to see if everything is working well. """
+    list_of_all_existing_things:"weakref.WeakSet[Thing]" = weakref.WeakSet()
+    """ Each Thing gets listed here, e.g., to see if everything is working well. Weak, so that the listing does not keep unused Things alive. """
+
+    _instance_cache:"weakref.WeakValueDictionary[Any,Thing]"
+    """ Instances of this very class keyed by the constructor arguments, see `ThingMeta.__call__`. Weak, not to keep unused Things alive. """
+
+    _mass_overridden:bool
+    """ Whether the class provides its own (e.g., measured) `mass`, see `density`. """
+
+    _all_attr_names:frozenset[str]
+    """ Names defined on the class and its bases, which may never be shadowed by an instance attribute. """
 
     # ====================================================
     # === Attributes, Components, Hierarchy and Magic ====
@@ -255,14 +420,46 @@ class Thing (ABC, metaclass=ThingMeta):
         captured_init:Callable = cls.__init__
         ORIG_INIT_REFERENCES[cls] = cls.__init__
         method_signature:inspect.Signature = inspect.signature(captured_init)
-        def __init__(self:Thing, *args, **kwargs) -> None:
+        def bind_slow(self:Thing, args:tuple, kwargs:dict[str,Any]) -> dict[str,Any]:
+            """ Generic binding, which also raises the appropriate TypeError on mismatching arguments. """
             bound:inspect.BoundArguments = method_signature.bind(self, *args,**kwargs)
             bound.apply_defaults()
-            if Thing.CAPTURED_PARAMETER_ATTRIBUTE_NAME not in self.__dict__:
-                self.__dict__[Thing.CAPTURED_PARAMETER_ATTRIBUTE_NAME] = []
-            self.__dict__[Thing.CAPTURED_PARAMETER_ATTRIBUTE_NAME].append((cls, bound.arguments))
+            return bound.arguments
+        if all(p.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD for p in method_signature.parameters.values()):
+            # NOTE: The common case of a plain parameter list is bound directly, as Signature.bind dispatches on parameter kinds on every call.
+            param_names:tuple[str,...] = tuple(method_signature.parameters.keys())
+            param_defaults:dict[str,Any] = {n: p.default for n, p in method_signature.parameters.items() if p.default is not inspect.Parameter.empty}
+            def bind(self:Thing, args:tuple, kwargs:dict[str,Any]) -> dict[str,Any]:
+                if len(args) >= len(param_names):
+                    return bind_slow(self, args, kwargs)
+                arguments:dict[str,Any] = dict(zip(param_names, (self,) + args))
+                consumed = 0
+                for name in param_names[len(args)+1:]:
+                    if name in kwargs:
+                        arguments[name] = kwargs[name]
+                        consumed += 1
+                    elif name in param_defaults:
+                        arguments[name] = param_defaults[name]
+                    else:
+                        return bind_slow(self, args, kwargs)
+                if consumed != len(kwargs):
+                    return bind_slow(self, args, kwargs)
+                return arguments
+        else:
+            bind = bind_slow
+        param_key:str = Thing.CAPTURED_PARAMETER_ATTRIBUTE_NAME
+        def __init__(self:Thing, *args, **kwargs) -> None:
+            arguments = bind(self, args, kwargs)
+            d = self.__dict__
+            captured = d.get(param_key)
+            if captured is None:
+                captured = d[param_key] = []
+            captured.append((cls, arguments))
             return captured_init(self, *args, **kwargs )
         cls.__init__ = __init__
+        cls._instance_cache = weakref.WeakValueDictionary()
+        cls._mass_overridden = cls.mass is not Thing.mass
+        cls._all_attr_names = frozenset(dir(cls))
         return super().__init_subclass__()
 
     def __init__(self, material:Material) -> None:
@@ -273,9 +470,9 @@ class Thing (ABC, metaclass=ThingMeta):
         """
 
         if "Thing.__init__" in DEBUG:
-            print(f"Thing.__init__ start on {colored.Fore.cyan} {repr(self)}{colored.Style.reset}.")
+            print(f"Thing.__init__ start on {_CYAN} {repr(self)}{_RESET}.")
 
-        Thing.list_of_all_existing_things.append(self)
+        Thing.list_of_all_existing_things.add(self)
 
         super().__init__()
 
@@ -289,7 +486,7 @@ class Thing (ABC, metaclass=ThingMeta):
         """ Each `Thing` may be anotated with miscellaneous data, like physical density, render color etc... """
 
         if "Thing.__init__" in DEBUG:
-            print(f"Thing.__init__ end on {colored.Fore.cyan} {repr(self)}{colored.Style.reset}.")
+            print(f"Thing.__init__ end on {_CYAN} {repr(self)}{_RESET}.")
 
         self.origin = MountPoint(bd.Location())
         """ Each Thing is defined in a coordinate frame with this as its origin. """
@@ -307,9 +504,9 @@ class Thing (ABC, metaclass=ThingMeta):
     @final
     def __setattr__(self, __name: str, __value: Any) -> None:
         assert __name.isidentifier(), f"Name {colored.Fore.red}{__name}{colored.Style.reset} is not an identifier."
-        if __name in dir(self):
+        if __name in self.__dict__ or __name in type(self)._all_attr_names:
             raise AttributeError(f"Attribute {__name} cannot be reassigned. Instantiate a new Thing by `new_altered` method if you need to modify it.")
-        elif not(inspect.stack()[1].function == "__init__" or (inspect.stack()[1].function == "__setitem__" and inspect.stack()[2].function == "__init__")):
+        elif not(sys._getframe(1).f_code.co_name == _INIT or (sys._getframe(1).f_code.co_name == _SETITEM and sys._getframe(2).f_code.co_name == _INIT)):
             raise AttributeError("You can assign only during __init__.")
         #elif __name == Thing.CAPTURED_PARAMETER_ATTRIBUTE_NAME:
         #    assert isinstance(__value, ConstNamespace), f"Property `{__name}` is reserved for storing constructor parameters."
@@ -324,15 +521,12 @@ class Thing (ABC, metaclass=ThingMeta):
             if __value.owned():
                 assert __value.owner is self and __value.known_as == __name
             else:
+                assert __value.owner is None and __value.known_as is None
                 __value.owner = self
                 __value.known_as = __name
-        if "Thing.__setattr__" in DEBUG:
-            print(f"Thing.__setattr__ {colored.Fore.cyan}{repr(self)}{colored.Style.reset} . {colored.Fore.green}{__name}{colored.Style.reset} = {colored.Fore.red}{repr(__value)}{colored.Style.reset}")
-            try:
-                code_context = inspect.stack()[1].code_context[0].strip()[:100] # type: ignore
-            except:
-                code_context = "<code context not available>"
-            print(f" {colored.Fore.rgb(100,100,100)}\\_> ...{inspect.stack()[1].filename[-20:]}:{inspect.stack()[1].lineno}   {code_context}{colored.Style.reset}")
+        if _DEBUG_SETATTR:
+            print(f"Thing.__setattr__ {_CYAN}{repr(self)}{_RESET} . {_GREEN}{__name}{_RESET} = {_RED}{repr(__value)}{_RESET}")
+            _print_debug_caller()
         self.__dict__[__name] = __value
 
     @staticmethod
@@ -353,31 +547,15 @@ class Thing (ABC, metaclass=ThingMeta):
         """ Either a construction element is retrieved, or a AbstractJointGrounder which facilitates dynamic transformation resolution.
         This is the only entry point to the Grounder mechanism.
         """
-        __dict__ = super().__getattribute__("__dict__")
-        if __name in __dict__:
-            __value:Any = self.__dict__[__name]
-            if isinstance(__value, MountPoint):
-                ret = TransformResolver(__value)
-            else:
-                ret = __value
-            if "Thing.__getattr__" in DEBUG:
-                print(f"Thing.__getattr__ {colored.Fore.cyan}{repr(self)}{colored.Style.reset} . {colored.Fore.green}{__name}{colored.Style.reset} -> {repr(ret)}")
-                try:
-                    code_context = inspect.stack()[1].code_context[0].strip()[:100] # type: ignore
-                except:
-                    code_context = "<code context not available>"
-                print(f" {colored.Fore.rgb(100,100,100)}\\_> ...{inspect.stack()[1].filename[-20:]}:{inspect.stack()[1].lineno}   {code_context}{colored.Style.reset}")
-            return ret
-        else:
-            __value = super().__getattribute__(__name)
-            if False and "Thing.__getattr__" in DEBUG:
-                print(f"Thing.__getattr__ {colored.Fore.cyan}{repr(self)}{colored.Style.reset} . {colored.Fore.green}{__name}{colored.Style.reset} -> {repr(__value)}")
-                try:
-                    code_context = inspect.stack()[1].code_context[0].strip()[:100] # type: ignore
-                except:
-                    code_context = "<code context not available>"
-                print(f" {colored.Fore.rgb(100,100,100)}\\_> ...{inspect.stack()[1].filename[-20:]}:{inspect.stack()[1].lineno}   {code_context}{colored.Style.reset}")
-            return __value
+        __value:Any = object.__getattribute__(self, "__dict__").get(__name, _MISSING)
+        if __value is _MISSING:
+            return object.__getattribute__(self, __name)
+        if type(__value) is MountPoint:
+            __value = TransformResolver(__value)
+        if _DEBUG_GETATTR:
+            print(f"Thing.__getattr__ {_CYAN}{repr(self)}{_RESET} . {_GREEN}{__name}{_RESET} -> {repr(__value)}")
+            _print_debug_caller()
+        return __value
 
     @final
     def adjust (self, cls=None, **kwargs) -> "Thing":
@@ -399,8 +577,8 @@ class Thing (ABC, metaclass=ThingMeta):
         if cls is None:
             #print(f"Resolving implicitly.")
             def arg_basename(arg_name:str):
-                fnd = arg_name.find("__")
-                return arg_name, arg_name[:fnd] if fnd > 0 else arg_name
+                head, _, _ = arg_name.partition("__")
+                return arg_name, head or arg_name
             resolved_index = 0
             for origname, basename in map(arg_basename, kwargs.keys()):
                 if origname in ("__add", "__mul"):
@@ -420,9 +598,8 @@ class Thing (ABC, metaclass=ThingMeta):
                     print(f"Resolving as {cls_candidate}.")
                     break
             assert found, f"Cannot find requested adjust-bace class {cls} among captured_param_list of {self}."
-        params = copy.copy(captured_param_list[resolved_index][1])
-        if "self" in params:
-            del params["self"]
+        params = dict(captured_param_list[resolved_index][1])
+        params.pop("self", None)
         modified_lookup = set()
         add_all:float = 0
         mul_all:float = 1
@@ -435,12 +612,12 @@ class Thing (ABC, metaclass=ThingMeta):
                 mul_all = value
                 continue
             elif name.endswith("__add"):
-                name = name[:-5]
+                name = name.removesuffix("__add")
                 assert name not in modified_lookup
                 modified_lookup.add(name)
                 value = params[name] + value
             elif name.endswith("__mul"):
-                name = name[:-5]
+                name = name.removesuffix("__mul")
                 assert name not in modified_lookup
                 modified_lookup.add(name)
                 value = params[name] * value
@@ -471,50 +648,61 @@ class Thing (ABC, metaclass=ThingMeta):
     def enumerate_reference_geometries(self, recurse=False, d0=True, d1=True, d2=True, d3=True) -> Generator[Tuple[str,Any], None, None]:
         """ Enumerates all unique attributes regarded as this Thing's construction or reference components.
         These might or might not equal to the Thing's `result`.
-        Also, lists are expanded and specific properites like __owner__ etc are ignored to prevent infinite recursion. """
+        Also, lists are expanded and specific properites like __owner__ etc are ignored to prevent infinite recursion.
+        As the Thing is immutable, the enumeration is computed once per filter combination and replayed afterwards. """
+        cache:dict[tuple[bool,...],tuple[int,list[Tuple[str,Any]]]] = _REFERENCE_GEOMETRIES_CACHE.setdefault(self, {})
+        key = (d0, d1, d2, d3)
+        version = len(self.__dict__) # NOTE: Attributes are only ever added (during __init__), so the count identifies the state.
+        cached = cache.get(key)
+        if cached is None or cached[0] != version:
+            cached = cache[key] = (version, list(self._enumerate_reference_geometries(d0, d1, d2, d3)))
+        yield from cached[1]
+
+    def _enumerate_reference_geometries(self, d0:bool, d1:bool, d2:bool, d3:bool) -> Generator[Tuple[str,Any], None, None]:
+        """ The uncached implementation of `enumerate_reference_geometries`. """
         idset:Set[int] = set()
+        filtered:bool = not (d0 and d1 and d2 and d3)
         for name, value in self.__dict__.items():
             if id(value) in idset:
                 continue
             else:
                 idset.add(id(value))
 
-            try:
-                if not d0 and isinstance(value, bd.Location|bd.Vector):
+            if filtered:
+                if not d0 and isinstance(value, _LOC_VEC):
                     continue
-                if not d1 and value._dim == 1:
+                dim = getattr(value, "_dim", None)
+                if not d1 and dim == 1:
                     continue
-                if not d2 and value._dim == 2:
+                if not d2 and dim == 2:
                     continue
-                if not d3 and value._dim == 3:
+                if not d3 and dim == 3:
                     continue
-            except AttributeError:
-                ...
 
             if isinstance(value, list):
-                for i, subvalue in enumerate(filter(lambda x : isinstance(x, Thing.COMPONENT_TYPE) or isinstance(x, Thing) or isinstance(x, AbstractJoint), value)):
+                for i, subvalue in enumerate(filter(lambda x : isinstance(x, _T_LISTED), value)):
                     yield name + str(i), subvalue
             elif isinstance(value, dict):
-                for subname, subvalue in filter(lambda x : isinstance(x[1], Thing.COMPONENT_TYPE) or isinstance(x[1], Thing) or isinstance(x[1], AbstractJoint), value.values()):
+                for subname, subvalue in filter(lambda x : isinstance(x[1], _T_LISTED), value.values()):
                     yield name + ":" + subname, subvalue
-            elif isinstance(value, Thing.COMPONENT_TYPE):
+            elif isinstance(value, _T_COMPONENT):
                 yield name, value
             elif isinstance(value, ReferenceTransformResolver):
                 yield name, value
 
     @final
     def enumerate_mount_locations(self) -> Generator[Tuple[str,bd.Location], None, None]:
-        idset:Set[int] = set()
-        for name, value in self.__dict__.items():
-            if isinstance(value, MountPoint):
+        d = self.__dict__
+        for name, value in d.items():
+            if type(value) is MountPoint:
                 yield name, value.location
 
     @final
     def enumerate_assembly(self, subassembly = True, where_attached = False, reference = False) -> Generator[Tuple[str,"TransformResolver"], None, None]:
         """ Enumerates all other `Things` attached to `self` via an instance of `AbstractJoint`. """
-        idset:Set[int] = set()
-        for name, value in self.__dict__.items():
-            if isinstance(value, MountPoint):
+        d = self.__dict__
+        for name, value in d.items():
+            if type(value) is MountPoint:
                 if subassembly and value._joint_outbound is not None:
                     yield name, TransformResolver(value)
                 if where_attached:
@@ -528,6 +716,19 @@ class Thing (ABC, metaclass=ThingMeta):
         """ Since a Thing is read-only, no real copy is necessary. """
         return self
 
+    @final
+    def __deepcopy__(self, memo:dict[int,Any]) -> "Thing":
+        """ Neither a deep copy is necessary; the assembly DAG is shared intentionally. """
+        memo[id(self)] = self
+        return self
+
+    @final
+    def __reduce__(self) -> tuple[Callable, tuple]:
+        """ Pickles the Thing as a constructor call with the captured parameters, so that unpickling goes through the instance cache instead of restoring a copy of the whole `__dict__`. """
+        # NOTE: The very arguments of the original call are replayed, so that they make the same key in the instance cache.
+        args, kwds = _CALL_ARGUMENTS[self]
+        return _reconstruct_thing, (type(self), args, kwds)
+
     # ====================================================
     # === Moving, Attaching and Aligning =================
     # ====================================================
@@ -566,14 +767,27 @@ class Thing (ABC, metaclass=ThingMeta):
             moved_location = moved_location.location
         if not isinstance(target_location, bd.Location):
             target_location = target_location.location
-        ret = target_location * bd.Location((0,0,0),(180,0,90)) * moved_location.inverse()
+        ret = _compose(target_location, MOUNTING_LOCATION, moved_location.inverse())
         return ret
 
+    @staticmethod
+    def get_aligning_transforms_batch(pairs:list[tuple[MountPoint|bd.Location, MountPoint|bd.Location]]) -> np.ndarray:
+        """ Same as `get_aligning_transform` for many `(target_location, moved_location)` pairs at once.
+        return: homogeneous matrices of shape `(len(pairs), 4, 4)`, translations in millimeters. """
+        targets = _location_matrices([t if isinstance(t, bd.Location) else t.location for t, _ in pairs])
+        moveds = _location_matrices([m if isinstance(m, bd.Location) else m.location for _, m in pairs])
+        # NOTE: The locations are rigid, hence the inverse is the transposed rotation with the back-rotated negative translation.
+        moveds_inv = np.zeros_like(moveds)
+        moveds_inv[:, :3, :3] = moveds[:, :3, :3].transpose(0, 2, 1)
+        moveds_inv[:, :3, 3] = -np.einsum("nij,nj->ni", moveds_inv[:, :3, :3], moveds[:, :3, 3])
+        moveds_inv[:, 3, 3] = 1
+        return targets @ _MOUNTING_MATRIX @ moveds_inv
+
     # ====================================================
     # === Explicitly Named Miscellaneous Properties ======
     # ====================================================
 
-    @memoize
+    @_cached_per_thing
     def volume_mm3(self, recurse=False) -> float:
         """ Volume in cubic millimeters. """
         if recurse:
@@ -594,24 +808,38 @@ class Thing (ABC, metaclass=ThingMeta):
         if recurse:
             raise NotImplementedError("TBI.")
         else:
-            res = self.result()
-            if res is None:
-                return 0.0
-            else:
-                return self.__material__.density * res.volume * 1e-9
+            # NOTE: The cached volume is zero for Things without a result.
+            return self.__material__.density * self.volume_mm3() * 1e-9
 
     def density(self, recurse=False) -> float:
         """ Density in base SI units. """
         if recurse:
             raise NotImplementedError("TBI.")
-        if self.mass == Thing.mass:
+        if not type(self)._mass_overridden:
             return self.__material__.density
         else: # NOTE: The mass was overriden to provide in-vivo measured mass.
             return self.mass() / self.volume()
 
-    @memoize
-    def matrix_of_inertia(self, precise=False, tidy = True) -> Tuple[np.ndarray, np.ndarray]:
+    @_cached_per_thing
+    def _triangles(self, precise=False) -> np.ndarray|None:
+        """ The tessellated result as a read-only array of triangles of shape `(n_triangles, 3, 3)` in meters, or None if there is no result. """
+        res = self.result()
+        if res is None:
+            return None
+        what:bd.Part = res.scale(1e-3)
+        # NOTE: Same meshing as `export_stl` does, but the triangles are kept in memory.
+        vertices, triangles = what.tessellate(1e-3, angular_tolerance=.01 if precise else 0.1)
+        vertex_array = np.array([v.to_tuple() for v in vertices], dtype=np.float64).reshape(-1, 3)
+        ret = vertex_array[np.array(triangles, dtype=np.intp).reshape(-1, 3)]
+        ret.flags.writeable = False
+        return ret
+
+    def matrix_of_inertia(self, precise=False, tidy = True, recurse=False) -> Tuple[np.ndarray, np.ndarray]:
         """ The resulting matrix of inertia w.r.t. the part's center of gravity.
+        If `recurse`, the whole assembly in its current state is considered, integrated at once over the triangles of all the assembled Things.
+        The inertia is always integrated over the fine tessellation and the one result serves both values of `precise`; the coarse one does not save enough to be worth a second meshing.
+        The `precise` and `tidy` arguments are kept for compatibility only; no intermediate file is written anymore.
+        The cached arrays are copied on return, so the caller may alter them.
         return: matrix_of_inertia, center_of_gravity """
 
         # NOTE: Alternatively computed by
@@ -623,26 +851,54 @@ class Thing (ABC, metaclass=ThingMeta):
         #geom = ms.get_geometric_measures()
         #tensor = geom["inertia_tensor"]
 
-
-        # NOTE: As I use density regularization, then following warning is not required. warnings.warn("The mass is not considered yet!")
-        res = self.result()
-        if res is None:
-            return np.zeros((3,3)), np.array([0,0,0])
+        cache = _thing_cache(self)
+        key = ("matrix_of_inertia", recurse)
+        version = _JOINT_STATE_VERSION if recurse else 0
+        cached = cache.get(key)
+        if cached is not None and cached[0] == version:
+            inertia, cog = cached[1]
+            return inertia.copy(), cog.copy()
+
+        if not recurse:
+            # NOTE: As I use density regularization, then following warning is not required. warnings.warn("The mass is not considered yet!")
+            triangles = self._triangles(True)
+            if triangles is None:
+                ret = np.zeros((3,3)), np.array([0,0,0])
+            else:
+                _, cog, inertia = _mass_properties(triangles)
+                inertia *= self.density()
+                ret = inertia, cog
         else:
-            what:bd.Part = res.scale(1e-3)
-            filename = random_tmp_fname(ext=".stl")
-            what.export_stl(filename, angular_tolerance=.01 if precise else 0.1)
-            _, cog, inertia = mesh.Mesh.from_file(filename).get_mass_properties()
-            inertia *= self.density()
-            if tidy:
-                os.remove(filename)
-            elif "Thing.matrix_of_inertia" in DEBUG:
-                print(f"The STL for computing the matrix of inertia is in tmp file {filename}")
-            return inertia, cog
+            # Gather the triangles of all assembled Things, moved to the frame of `self` and weighted by their densities.
+            moved_triangles:list[np.ndarray] = []
+            densities:list[np.ndarray] = []
+            def collect(tr:TransformResolver) -> None:
+                triangles = tr.wrapped._triangles(True)
+                if triangles is not None:
+                    matrix = _location_matrices([tr.transform])[0, :3]
+                    moved_triangles.append(triangles @ matrix[:,:3].T + matrix[:,3] * 1e-3)
+                    densities.append(np.full(len(triangles), tr.wrapped.density()))
+                for _, nxt in tr.enumerate_assembly():
+                    collect(nxt)
+            collect(ReferenceTransformResolver(self, bd.Location()))
+            if len(moved_triangles) == 0:
+                ret = np.zeros((3,3)), np.array([0,0,0])
+            else:
+                _, cog, inertia = _mass_properties(np.concatenate(moved_triangles), np.concatenate(densities))
+                ret = inertia, cog
+        cache[key] = (version, ret)
+        return ret[0].copy(), ret[1].copy()
 
     @final
     def bounding_box(self, consider_construction:bool = False, consider_assembly:bool = False) -> bd.BoundBox:
-        """ Computes bounding box considering all values merged. """
+        """ Computes bounding box considering all values merged.
+        The box is cached; the one considering the assembly is recomputed only after some joint was set. A copy is returned, so the caller may alter it. """
+        cache = _thing_cache(self)
+        key = ("bounding_box", consider_construction, consider_assembly)
+        version = _JOINT_STATE_VERSION if consider_assembly else 0
+        cached = cache.get(key)
+        if cached is not None and cached[0] == version:
+            return _copy_bound_box(cached[1])
         res = self.result()
         bb:bd.BoundBox = bd.Box(10,10,10).bounding_box() if res is None else res.bounding_box()
         if consider_construction:
@@ -657,17 +913,17 @@ class Thing (ABC, metaclass=ThingMeta):
             for _, value in self.enumerate_assembly():
                 assert isinstance(value, TransformResolver)
                 bb.add(value.bounding_box()) # type: ignore
-        return bb
+        cache[key] = (version, bb)
+        return _copy_bound_box(bb)
 
     # ====================================================
     # === Visualization and Debug ========================
     # ====================================================
 
     def __str__(self):
-        lines = [f"Thing {colored.Fore.green}{repr(self)}{colored.Style.reset}#{colored.Fore.yellow}{id(self)}{colored.Style.reset}"]
+        lines = [_STR_HEAD_FMT % (self, id(self))]
         for key, value in self.__dict__.items():
-            lines.append(f" - {colored.Fore.cyan}{key}{colored.Style.reset} is {colored.Fore.green}{repr(value)}{colored.Fore.yellow}#{id(value)}{colored.Style.reset}")
-            lines[-1] += colored.Style.reset
+            lines.append(_STR_LINE_FMT % (key, value, id(value)))
         return "\n".join(lines)
 
     def codename(self)->str:
@@ -696,7 +952,7 @@ class AbstractJoint (ABC):
     @abstractmethod
     def transform(self,mount_from:MountPoint, mount_to:MountPoint) -> bd.Location:
         """ Each implementation is responsible to declare the transform from one to another.
-        As both mountpoints are owned by their respective Things, the implementation has to identify them by equalling against this joints attributes. Use always is operator, not the equality. This is currently regarded as necessary evil.
+        As both mountpoints are owned by their respective Things, the implementation has to identify them by equalling against this joints attributes. Use always is operator, not the equality, or the `_which` lookup. This is currently regarded as necessary evil.
 
         If the mount point had "second owner", which would reference this joint for convenience, it would make multi-mounting very hard.
         """
@@ -719,6 +975,8 @@ class AbstractJoint (ABC):
         assert moving_mount.owner is not reference_mount.owner
 
         # Inject the mounts to keep track how many joints are attached so far
+        global _JOINT_STATE_VERSION
+        _JOINT_STATE_VERSION += 1
         reference_mount._joint_outbound = self
         if mounts_are_peers:
             moving_mount._joint_outbound = self
@@ -742,23 +1000,29 @@ class AbstractJoint (ABC):
         self.global_name:None|str = None if not hasattr(self, "global_name") else self.global_name
         """ Any joint may carry some label to identify it globally among the whole design.
         This rather wild conditional assignment allows setting it in subclass constructor befor or after calling this init."""
+        self._mounts:tuple[MountPoint,MountPoint] = (reference_mount, moving_mount)
+        """ Both mounts indexed as reported by `_which`. """
+        self._mount_index:dict[int,int] = {id(reference_mount): 0, id(moving_mount): 1}
+        """ Identity lookup of the mounts; the ids stay valid as the mounts are referenced above. """
         self.set_default()
 
+    def _which(self, mount:MountPoint) -> int:
+        """ Identifies the given mount by identity: 0 for the reference mount, 1 for the moving one. """
+        try:
+            return self._mount_index[id(mount)]
+        except KeyError:
+            raise ValueError
+
     def get_other_mount(self, ref:MountPoint) -> MountPoint:
         """ Identifies the mount which a given Thing is attached by this Joint. """
-        if ref is self.reference_mount:
-            return self.moving_mount
-        elif ref is self.moving_mount:
-            return self.reference_mount
-        else:
-            raise ValueError
+        return self._mounts[1 - self._which(ref)]
 
     def __str__(self) -> str:
         return f"{repr(self)} linking {repr(self.reference_mount.owner)}.{self.reference_mount.known_as} <-> {repr(self.moving_mount.owner)}.{self.moving_mount.known_as}"
 
     @final
     def __setattr__(self, name, value) -> None:
-        assert name in ("__param_args__", "__param_kwargs__") or inspect.stack()[1].function == "__init__"
+        assert name in ("__param_args__", "__param_kwargs__", "__state_version__") or sys._getframe(1).f_code.co_name == _INIT
         self.__dict__[name] = value
 
     @abstractmethod
@@ -769,9 +1033,12 @@ class AbstractJoint (ABC):
     def set(self, *args, **kwargs):
         """ Override this method to check semantic validity of the parameters.
         Call this superclass method to store the currently applied parameters here."""
+        global _JOINT_STATE_VERSION
         self.__param_args__ = args
         self.__param_kwargs__ = kwargs
-        if "AbstractJoint.set" in DEBUG: print(f"{colored.Fore.cyan}{repr(self)}{colored.Style.reset} . {colored.Fore.green}set{colored.Style.reset} ( {args} / {kwargs} )")
+        self.__state_version__ = self.__dict__.get("__state_version__", 0) + 1
+        _JOINT_STATE_VERSION += 1
+        if "AbstractJoint.set" in DEBUG: print(f"{_CYAN}{repr(self)}{_RESET} . {_GREEN}set{_RESET} ( {args} / {kwargs} )")
 
     @final
     def __call__(self, *args, **kwargs):
@@ -782,6 +1049,9 @@ class TransformResolver:
     """ A class which wraps objects in the assembly, gradually tracking an expression chain together with particular incremental transforms.
     Thankfully, the job is quite simple due to binary joints. Wrap another Thing which is unambiguously referenced in constructor.
     """
+
+    __slots__ = ("_joint", "_transform", "_orig_mount", "_next_mount", "_wrapped", "_previous")
+
     def __init__(self, mount_point:MountPoint, which:int|None=None) -> None:
         """ Finds a Thing attached to the mount point according to the `which` argument.
 
@@ -798,17 +1068,14 @@ class TransformResolver:
                 joint = None
 
         if joint is not None:
-            assert isinstance(mount_point, MountPoint)
-            assert isinstance(mount_point.location, bd.Location), f"Instead: {mount_point} - {mount_point.location} of type {type(mount_point.location)}"
             next_mount = joint.get_other_mount(mount_point)
-            joint_transform = joint.transform(mount_point, next_mount)
-            full_transform = mount_point.location * joint_transform * bd.Location((0,0,0),(180,0,90)) * next_mount.location.inverse()
+            full_transform = _MISSING # NOTE: Resolved lazily in `self.transform`, many accesses need only the wrapped Thing or the joint.
         else:
             full_transform = bd.Location() # mount_point.location
             next_mount = None
 
         if "TransformResolver.__init__" in DEBUG:
-            print(f"{colored.Fore.cyan}{repr(self)}{colored.Style.reset} . {colored.Fore.green}__init__{colored.Style.reset} : {colored.Fore.red}{mount_point.location}{colored.Style.reset}")
+            print(f"{_CYAN}{repr(self)}{_RESET} . {_GREEN}__init__{_RESET} : {_RED}{mount_point.location}{_RESET}")
 
         self._joint = joint
         """ The joint through which the thing was accessed. """
@@ -816,7 +1083,7 @@ class TransformResolver:
         self._transform:bd.Location = full_transform
         """ The (cummulative) transform.
 
-        In constructor, the transform is computed as
+        On first read, the transform is computed as
         ```
         mount_point.owner -----> mount_point.location -----> joint_transform -----> mating_transform -----> next_mount.location.inverse() -----> next_mount.owner
         ```
@@ -852,7 +1119,7 @@ class TransformResolver:
     def enumerate_assembly(self, *args, **kwargs) -> Generator[tuple[str, "TransformResolver"], None, None]:
         for n, v in self.wrapped.enumerate_assembly(*args, **kwargs):
             assert isinstance(v, TransformResolver)
-            v._transform = self.transform * v.transform
+            v._transform = _compose(self.transform, v.transform)
             v._previous = self
             yield n, v
 
@@ -860,12 +1127,30 @@ class TransformResolver:
     def location(self) -> bd.Location:
         """ Alias to `self._transform`. But may be also used for self._orig_mount.location """
         #warn("The semantics of this property is not clear. It may lead to unexpected behavior. Please report your usage of this property such it can be fixed.")
-        return self._transform * self._orig_mount.location
+        return _compose(self.transform, self._orig_mount.location)
 
     @property
     def transform(self) -> bd.Location:
         """ The cummulative transform. Alias to `self._transform`. """
-        return self._transform
+        __value = self._transform
+        if __value is _MISSING:
+            __value = self._transform = self._resolve_transform()
+        return __value
+
+    def _resolve_transform(self) -> bd.Location:
+        """ Computes the transform through the joint, reusing the one cached in the mount point unless the joint was set since. """
+        mount_point, next_mount, joint = self._orig_mount, self._next_mount, self._joint
+        assert joint is not None and next_mount is not None
+        version = joint.__dict__.get("__state_version__", 0)
+        cached = mount_point._resolved.get(joint)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        assert isinstance(mount_point, MountPoint)
+        assert isinstance(mount_point.location, bd.Location), f"Instead: {mount_point} - {mount_point.location} of type {type(mount_point.location)}"
+        joint_transform = joint.transform(mount_point, next_mount)
+        full_transform = _compose(mount_point.location, joint_transform, MOUNTING_LOCATION, next_mount.location.inverse())
+        mount_point._resolved[joint] = (version, full_transform)
+        return full_transform
 
     @property
     def wrapped(self) -> Thing:
@@ -882,42 +1167,70 @@ class TransformResolver:
         assert isinstance(__value, TransformResolver)
         self._previous = __value
 
+    _KIND_DIRECT:int = 0
+    _KIND_PARAMETERS:int = 1
+    _KIND_RESOLVER:int = 2
+    _KIND_CALLABLE:int = 3
+    _KIND_MOVABLE:int = 4
+    """ How `__getattr__` treats the accessed value. """
+
+    _ATTR_KIND_CACHE:dict[type,int] = {}
+    """ The kind of accessed values by their type, so that the chain of checks runs once per type. """
+
+    @staticmethod
+    def _attr_kind(__value:Any) -> int:
+        if isinstance(__value, ParameterResolver):
+            return TransformResolver._KIND_PARAMETERS
+        elif isinstance(__value, TransformResolver):
+            return TransformResolver._KIND_RESOLVER
+        elif callable(__value):
+            return TransformResolver._KIND_CALLABLE
+        elif hasattr(__value, "move") and callable(__value.move):
+            return TransformResolver._KIND_MOVABLE
+        elif isinstance(__value, bd.Location):
+            return TransformResolver._KIND_MOVABLE
+        else:
+            return TransformResolver._KIND_DIRECT
+
     def __getattr__(self, __name:str):
         __value = getattr(self.wrapped, __name)
         if "TransformResolver.__getattr__" in DEBUG:
-            print(f"{colored.Fore.cyan}{repr(self)}{colored.Style.reset} . {colored.Fore.green}{__name}{colored.Style.reset} -> {colored.Fore.red}{str(__value)}{colored.Style.reset}")
-        if isinstance(__value, ParameterResolver):
+            print(f"{_CYAN}{repr(self)}{_RESET} . {_GREEN}{__name}{_RESET} -> {_RED}{str(__value)}{_RESET}")
+        kind = TransformResolver._ATTR_KIND_CACHE.get(type(__value))
+        if kind is None:
+            kind = TransformResolver._ATTR_KIND_CACHE[type(__value)] = TransformResolver._attr_kind(__value)
+        if kind == TransformResolver._KIND_PARAMETERS:
             return __value
-        elif isinstance(__value, TransformResolver):
-            __value._transform = self.transform * __value.transform
+        elif kind == TransformResolver._KIND_RESOLVER:
+            __value._transform = _compose(self.transform, __value.transform)
             __value._previous = self
             return __value
-        elif callable(__value):
+        elif kind == TransformResolver._KIND_CALLABLE:
             def proxy (*args, **kwargs):
                 result = __value(*args, **kwargs)
                 if "TransformResolver.__getattr__" in DEBUG:
-                    print(f"{colored.Fore.cyan}{repr(self)}{colored.Style.reset} . {colored.Fore.green}{__name} PROXY CALL{colored.Style.reset} -> {colored.Fore.red}{repr(result)}{colored.Style.reset}")
+                    print(f"{_CYAN}{repr(self)}{_RESET} . {_GREEN}{__name} PROXY CALL{_RESET} -> {_RED}{repr(result)}{_RESET}")
                 if isinstance(result, Thing):
                     #raise NotImplementedError(f"!!!")
                     return ReferenceTransformResolver(result, self.transform, self.previous)
                 elif isinstance(result, TransformResolver):
-                    result._transform = self.transform * result.transform
+                    result._transform = _compose(self.transform, result.transform)
                     result._previous = self
                     return result
-                elif hasattr(result, "move") and callable(result.move):
+                move = getattr(result, "move", None)
+                if move is not None and callable(move):
                     return copy.copy(result).move(self.transform)
                 elif isinstance(result, bd.Location):
-                    return self.transform * copy.copy(result)
+                    return _compose(self.transform, result)
                 else:
                     return result
             return proxy
-        elif hasattr(__value, "move") and callable(__value.move):
-            return self.transform * copy.copy(__value)
-        elif isinstance(__value, bd.Location):
-            return self.transform * copy.copy(__value)
+        elif kind == TransformResolver._KIND_MOVABLE:
+            # NOTE: Multiplying by a location always returns a new object, no copy is needed.
+            return self.transform * __value
         else:
             if "TransformResolver.__getattr__" in DEBUG:
-                print(f"{colored.Fore.rgb(100,100,100)} \\> direct return {colored.Style.reset}")
+                print(f"{_GREY} \\> direct return {_RESET}")
             return __value
 
     def __str__(self) -> str:
@@ -925,9 +1238,32 @@ class TransformResolver:
 
 class ReferenceTransformResolver(TransformResolver):
     """ Convenience to soft-move a foreign Thing. """
+
+    __slots__ = ()
+
     def __init__(self, thing:Thing, where:bd.Location, previous:TransformResolver|None=None) -> None:
         self._transform = where
         self._wrapped = thing
         self._previous = previous
 
 ORIG_INIT_REFERENCES:dict[type["Thing"],Callable] = {Thing: Thing.__init__}
+
+def _reconstruct_thing(cls:type[Thing], args:tuple, kwargs:dict[str,Any]) -> Thing:
+    """ Unpickling counterpart of `Thing.__reduce__`. """
+    return cls(*args, **kwargs)
+
+_REFERENCE_GEOMETRIES_CACHE:"weakref.WeakKeyDictionary[Thing,dict]" = weakref.WeakKeyDictionary()
+""" Enumerated reference geometries of each Thing. Kept outside of the instance as the Thing's `__dict__` is what gets enumerated. """
+
+_CALL_ARGUMENTS:"weakref.WeakKeyDictionary[Thing,tuple[tuple,dict[str,Any]]]" = weakref.WeakKeyDictionary()
+""" The positional and keyword arguments each Thing was constructed with, as received by `ThingMeta.__call__`; `Thing.__reduce__` replays them. """
+
+_PROPERTY_CACHE:"weakref.WeakKeyDictionary[Thing,dict]" = weakref.WeakKeyDictionary()
+""" Computed properties (volume, inertia, bounding box) of each Thing, see `_cached_per_thing`. """
+
+# NOTE: Type tuples for the hot `isinstance` checks, so that no union is built on each call. Defined here as they reference the classes above.
+_T_THING_NONE:tuple[type,...] = (Thing, type(None))
+_T_STR_NONE:tuple[type,...] = (str, type(None))
+_T_MP_TR:tuple[type,...] = (MountPoint, TransformResolver)
+_T_COMPONENT:tuple[type,...] = get_args(Thing.COMPONENT_TYPE)
+_T_LISTED:tuple[type,...] = _T_COMPONENT + (Thing, AbstractJoint)
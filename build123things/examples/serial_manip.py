@@ -53,10 +53,12 @@ class LinkProtoArm (Thing):
         super().__init__(Aether())
         self.servo = MountPoint(bd.Location())
         Rigid(self.servo, XM430().origin)
+        # NOTE: Both braces are the very same Thing, the second one is only mounted turned around.
+        brace = Connector_Rotor_Body()
         self.brace_a = MountPoint(self.servo.bottom)
-        Rigid(self.brace_a, Connector_Rotor_Body().mount_bottom)
+        Rigid(self.brace_a, brace.mount_bottom)
         self.brace_b = MountPoint(self.servo.bottom.location * bd.Location((0,0,0), (0,0,180)))
-        Rigid(self.brace_b, Connector_Rotor_Body().mount_bottom)
+        Rigid(self.brace_b, brace.mount_bottom)
         self.mount_by_braces = MountPoint(self.brace_a.mount_rotor)
     def result(self) -> None:
         return None
@@ -89,21 +91,23 @@ class EndEffector (Thing):
     def __init__(self, servo_clearance=22, thickness=3, pen_diameter=15) -> None:
         super().__init__(PETG())
         self.servo_ref:XM430 = xm430_clearance.move(bd.Location())
-        in_front = self.servo_ref.rotor_center.location.position + bd.Vector(0,servo_clearance,0)
+        rotor_center:bd.Location = self.servo_ref.rotor_center.location # NOTE: Resolved once, it is used repeatedly below.
+        in_front = rotor_center.position + bd.Vector(0,servo_clearance,0)
         sweep_trajectory = bd.Polyline(
-            self.servo_ref.rotor_center.location.position,
+            rotor_center.position,
             in_front,
             self.servo_ref.bearing_center.position + bd.Vector(0,servo_clearance,0),
         )
-        sweep_profile = self.servo_ref.rotor_center.location * bd.Location((0,0,0),(90,0,0)) * bd.Rectangle(width=self.servo_ref.p.rotor_radius_1*2+thickness*2, height=thickness, align=(CENTER,MIN))
-        body = bd.sweep(sweep_profile,sweep_trajectory,transition=bd.Transition.ROUND) + bd.extrude(self.servo_ref.rotor_center.location * bd.Circle(self.servo_ref.p.rotor_radius_1+thickness), amount=thickness) - bd.extrude(self.servo_ref.rotor_center.location * bd.Circle(self.servo_ref.p.rotor_radius_2), amount=thickness)
-        for i in range(8):
-            body -= getattr(self.servo_ref, f"screw_rotor_row1_{i}")(1.5).body_hull
+        sweep_profile = rotor_center * bd.Location((0,0,0),(90,0,0)) * bd.Rectangle(width=self.servo_ref.p.rotor_radius_1*2+thickness*2, height=thickness, align=(CENTER,MIN))
+        body = bd.sweep(sweep_profile,sweep_trajectory,transition=bd.Transition.ROUND) + bd.extrude(rotor_center * bd.Circle(self.servo_ref.p.rotor_radius_1+thickness), amount=thickness)
         self.pen = MountPoint(bd.Location(bd.Vector(0,servo_clearance+thickness,0), (90,-90,0)))
         Rigid(self.pen, EndEffectorCap().mount)
-        body -= self.pen.screw_1.body_hull
-        body -= self.pen.screw_2.body_hull
-        self.mount = MountPoint(self.servo_ref.rotor_center.location * MOUNTING_LOCATION)
+        # NOTE: All the holes are cut by a single boolean operation rather than one by one.
+        body -= [bd.extrude(rotor_center * bd.Circle(self.servo_ref.p.rotor_radius_2), amount=thickness)] + [getattr(self.servo_ref, f"screw_rotor_row1_{i}")(1.5).body_hull for i in range(8)] + [
+            self.pen.screw_1.body_hull,
+            self.pen.screw_2.body_hull,
+        ]
+        self.mount = MountPoint(rotor_center * MOUNTING_LOCATION)
         self.body = body
 
     def result(self) -> bd.Part | None:
@@ -130,15 +134,15 @@ class EndEffectorCap (Thing):
             (-limit_x,0),
         )
         self.sweep_profile = bd.Location((limit_x, 0, 0), (90,-90,90)) * bd.Rectangle(width=10, height=thickness, align=(CENTER,MIN))
+        screw = MetricScrew(3,5)
         self.screw_1 = MountPoint(bd.Location((screw_x,1.5,0),(-90,0,0)))
-        Rigid(self.screw_1, MetricScrew(3,5).base)
+        Rigid(self.screw_1, screw.base)
         self.screw_2 = MountPoint(bd.Location((-screw_x,1.5,0),(-90,0,0)))
-        Rigid(self.screw_2, MetricScrew(3,5).base)
-        self.body = (
-            bd.sweep(self.sweep_profile, self.sweep_trajectory, transition=bd.Transition.ROUND) -
-            self.screw_1.body_hull -
-            self.screw_2.body_hull
-        )
+        Rigid(self.screw_2, screw.base)
+        self.body = bd.sweep(self.sweep_profile, self.sweep_trajectory, transition=bd.Transition.ROUND) - [
+            self.screw_1.body_hull,
+            self.screw_2.body_hull,
+        ]
         self.mount = MountPoint(bd.Location((0,0,0),(0,0,0)))
         self.pen = MountPoint(bd.Location((0,pen_diameter/2,0),(0,0,0)))
         Rigid(self.pen, PenDummy().origin)
@@ -150,9 +154,10 @@ class Connector_Yaw_Pitch (Thing):
     def __init__(self, servo_extra_clearance=4, material_thickness=3) -> None:
         super().__init__(PETG())
         self.servo_yaw_ref:XM430 = xm430_clearance.move(bd.Location())
-        self.servo_yaw_mount = MountPoint(self.servo_yaw_ref.rotor_center.location * MOUNTING_LOCATION)
+        rotor_center:bd.Location = self.servo_yaw_ref.rotor_center.location
+        self.servo_yaw_mount = MountPoint(rotor_center * MOUNTING_LOCATION)
 
-        self.servo_pitch_mount = MountPoint(self.servo_yaw_ref.rotor_center.location * bd.Location((0,0,servo_extra_clearance)))
+        self.servo_pitch_mount = MountPoint(rotor_center * bd.Location((0,0,servo_extra_clearance)))
         self.servo_pitch_ref = Thing.align(self.servo_pitch_mount, xm430_clearance.top)
 
         box = self.servo_yaw_ref.rotor_sketch.location * bd.Box(
@@ -162,20 +167,20 @@ class Connector_Yaw_Pitch (Thing):
             align=(CENTER,CENTER,MIN)
         )
 
-        self.body = (
-            bd.fillet(box.edges(), material_thickness)
-            - self.servo_pitch_ref.hull # type: ignore
-            - self.servo_yaw_ref.hull # type: ignore
-            - bd.extrude(self.servo_yaw_ref.rotor_base.location * bd.Circle(self.servo_yaw_ref.p.rotor_radius_2), amount=100, both=True)
-            - self.servo_yaw_ref.screw_rotor_row1_0(1.5).adjust(width__add=.1).body_hull # type: ignore
-            - self.servo_yaw_ref.screw_rotor_row1_2(1.5).adjust(width__add=.1).body_hull # type: ignore
-            - self.servo_yaw_ref.screw_rotor_row1_4(1.5).adjust(width__add=.1).body_hull # type: ignore
-            - self.servo_yaw_ref.screw_rotor_row1_6(1.5).adjust(width__add=.1).body_hull # type: ignore
-            - self.servo_pitch_ref.screw_right_top_rear(1.5).adjust(width__add=.1).body_hull # type: ignore
-            - self.servo_pitch_ref.screw_right_top_front(1.5).adjust(width__add=.1).body_hull # type: ignore
-            - self.servo_pitch_ref.screw_left_top_rear(1.5).adjust(width__add=.1).body_hull # type: ignore
-            - self.servo_pitch_ref.screw_left_top_front(1.5).adjust(width__add=.1).body_hull # # type: ignore
-        )
+        # NOTE: All the cavities and holes are cut by a single boolean operation rather than one by one.
+        self.body = bd.fillet(box.edges(), material_thickness) - [
+            self.servo_pitch_ref.hull, # type: ignore
+            self.servo_yaw_ref.hull, # type: ignore
+            bd.extrude(self.servo_yaw_ref.rotor_base.location * bd.Circle(self.servo_yaw_ref.p.rotor_radius_2), amount=100, both=True),
+            self.servo_yaw_ref.screw_rotor_row1_0(1.5).adjust(width__add=.1).body_hull, # type: ignore
+            self.servo_yaw_ref.screw_rotor_row1_2(1.5).adjust(width__add=.1).body_hull, # type: ignore
+            self.servo_yaw_ref.screw_rotor_row1_4(1.5).adjust(width__add=.1).body_hull, # type: ignore
+            self.servo_yaw_ref.screw_rotor_row1_6(1.5).adjust(width__add=.1).body_hull, # type: ignore
+            self.servo_pitch_ref.screw_right_top_rear(1.5).adjust(width__add=.1).body_hull, # type: ignore
+            self.servo_pitch_ref.screw_right_top_front(1.5).adjust(width__add=.1).body_hull, # type: ignore
+            self.servo_pitch_ref.screw_left_top_rear(1.5).adjust(width__add=.1).body_hull, # type: ignore
+            self.servo_pitch_ref.screw_left_top_front(1.5).adjust(width__add=.1).body_hull, # type: ignore
+        ]
 
     def result(self) -> bd.Part | None:
         return self.body
@@ -186,9 +191,11 @@ class Connector_Rotor_Body (Thing):
         self.servo_a:XM430 = xm430_clearance.move(bd.Location((0,0,0),(0,0,180)))
         self.servo_b:XM430 = xm430_clearance.move(bd.Location((0,rotor_rotor_length,0),(0,0,0)))
 
-        sweep_start = self.servo_a.rotor_center.location.position
-        sweep_end = (0, self.servo_b.bottom.location.position.Y - thickness, 1)
-        sweep_mid = bd.Vector(0, self.servo_b.bottom.location.position.Y - thickness, sweep_start.Z)
+        rotor_center:bd.Location = self.servo_a.rotor_center.location
+        bottom:bd.Location = self.servo_b.bottom.location
+        sweep_start = rotor_center.position
+        sweep_end = (0, bottom.position.Y - thickness, 1)
+        sweep_mid = bd.Vector(0, bottom.position.Y - thickness, sweep_start.Z)
         sweep_curve = bd.Line(sweep_start, sweep_mid) + bd.Line(sweep_mid, sweep_end)
 
         body = (bd.sweep(
@@ -202,7 +209,7 @@ class Connector_Rotor_Body (Thing):
             )
         )
         rotor_mount = ( bd.extrude(
-                    self.servo_a.rotor_center.location * bd.Circle(radius=xm430_clearance.p.width/2),
+                    rotor_center * bd.Circle(radius=xm430_clearance.p.width/2),
                     amount=thickness
                 )
             )
@@ -213,18 +220,20 @@ class Connector_Rotor_Body (Thing):
             self.servo_a.rotor_center_sketch,
             amount=thickness
         )
+        # NOTE: The fillets precede the screw holes on purpose; some holes reach into the rounded edges, so filleting afterwards fails.
         body = bd.fillet(body.edges().group_by(bd.Axis.Z)[-1], radius=2) # type: ignore
         body = bd.fillet(body.edges().group_by(bd.Axis.Y)[-1], radius=2.5) # type: ignore
 
-        for i in range(8):
-            body -= getattr(self.servo_a, f"screw_rotor_row1_{i}")(1.5).body_hull
-        body -= self.servo_b.screw_bottom_left_front(1.5).body_hull
-        body -= self.servo_b.screw_bottom_right_front(1.5).body_hull
+        # NOTE: All the holes are cut by a single boolean operation rather than one by one.
+        body -= [getattr(self.servo_a, f"screw_rotor_row1_{i}")(1.5).body_hull for i in range(8)] + [
+            self.servo_b.screw_bottom_left_front(1.5).body_hull,
+            self.servo_b.screw_bottom_right_front(1.5).body_hull,
+        ]
 
         self.body=body
 
-        self.mount_rotor = MountPoint(self.servo_a.rotor_center.location * MOUNTING_LOCATION)
-        self.mount_bottom = MountPoint(self.servo_b.bottom.location * MOUNTING_LOCATION)
+        self.mount_rotor = MountPoint(rotor_center * MOUNTING_LOCATION)
+        self.mount_bottom = MountPoint(bottom * MOUNTING_LOCATION)
 
     def result(self) -> bd.Part | None:
         return self.body
@@ -239,18 +248,22 @@ class Connector_Base_Plate (Thing):
 
         body += self.servo.left.location * pad
         body += self.servo.right.location * pad
+        # NOTE: Filleting after the screw holes gives the same solid but is slower, the fillets then run on the more complex body.
         body = bd.fillet(body.edges().filter_by(bd.Axis.Z), 1)
         body = bd.fillet(body.edges().group_by(bd.Axis.Z)[-1], 1) # type: ignore
 
-        body -= self.servo.screw_left_top_rear(thickness*.8).body_hull
-        body -= self.servo.screw_left_top_front(thickness*.8).body_hull
-        body -= self.servo.screw_left_bottom_rear(thickness*.8).body_hull
-        body -= self.servo.screw_left_bottom_front(thickness*.8).body_hull
-
-        body -= self.servo.screw_right_top_rear(thickness*.8).body_hull
-        body -= self.servo.screw_right_top_front(thickness*.8).body_hull
-        body -= self.servo.screw_right_bottom_rear(thickness*.8).body_hull
-        body -= self.servo.screw_right_bottom_front(thickness*.8).body_hull
+        # NOTE: All the holes are cut by a single boolean operation rather than one by one.
+        body -= [
+            self.servo.screw_left_top_rear(thickness*.8).body_hull,
+            self.servo.screw_left_top_front(thickness*.8).body_hull,
+            self.servo.screw_left_bottom_rear(thickness*.8).body_hull,
+            self.servo.screw_left_bottom_front(thickness*.8).body_hull,
+
+            self.servo.screw_right_top_rear(thickness*.8).body_hull,
+            self.servo.screw_right_top_front(thickness*.8).body_hull,
+            self.servo.screw_right_bottom_rear(thickness*.8).body_hull,
+            self.servo.screw_right_bottom_front(thickness*.8).body_hull,
+        ]
 
         self.body = body
 
@@ -34,19 +34,19 @@ class VerySimpleCar (Thing):
 
         self.wheel_fl = MountPoint(bd.Location((-length/2*0.7, -width/2 + wheel_inset, 0), (90,0,0)))
         Revolute(self.wheel_fl, wheel.mount, limit_effort=100, limit_velocity=100)
-        body -= self.wheel_fl.adjust(radius__add = wheel_cutout).body
 
         self.wheel_fr= MountPoint(bd.Location((-length/2*0.7, width/2 - wheel_inset, 0),( -90,0,0)))
         Revolute(self.wheel_fr, wheel.mount, limit_effort=100, limit_velocity=100)
-        body -= self.wheel_fr.adjust(radius__add = wheel_cutout).body
 
         self.wheel_bl= MountPoint(bd.Location((length/2*0.7, -width/2 + wheel_inset, 0),( 90,0,0)))
         Revolute(self.wheel_bl, wheel.mount, limit_effort=100, limit_velocity=100)
-        body -= self.wheel_bl.adjust(radius__add = wheel_cutout).body
 
         self.wheel_br= MountPoint(bd.Location((length/2*0.7, width/2 - wheel_inset, 0),( -90,0,0)))
         Revolute(self.wheel_br, wheel.mount, limit_effort=100, limit_velocity=100)
-        body -= self.wheel_br.adjust(radius__add = wheel_cutout).body
+
+        # NOTE: The adjusted wheel is memoized, so it is built once as long as the cutouts hold it; the four placed copies are cut by a single boolean operation.
+        cutouts = [getattr(self, f"wheel_{i}").adjust(radius__add = wheel_cutout) for i in ("fl", "fr", "bl", "br")]
+        body -= [cutout.body for cutout in cutouts]
 
         self.antenna = MountPoint(bd.Location((100,width/4,height)))
         Rigid(self.antenna, Antenna(radius=20).mount)
@@ -39,15 +39,16 @@ def export(thing:Thing, include_reference=False) -> graphviz.Digraph:
     # TODO Style defined here.
     #graph.attr("color", "green")
 
-    nodes:dict[str,Thing] = {}
+    nodes:dict[int,Thing] = {}
+    """ The Things already in the graph, keyed by their ids; the ids are converted to node names only when passed to graphviz. """
 
     def process(tr:TransformResolver, as_name:str, as_construction:bool=False):
-        name = str(id(tr.wrapped))
-        label = tr.wrapped.codename()
+        wrapped = tr.wrapped
+        name = str(id(wrapped))
 
-        if name not in nodes:
-            nodes[name] = tr.wrapped
-            graph.node(name,label,attr="val")
+        if id(wrapped) not in nodes:
+            nodes[id(wrapped)] = wrapped
+            graph.node(name,wrapped.codename(),attr="val")
             recurse = True
         else:
             recurse = False
@@ -99,7 +100,7 @@ if __name__ == "__main__":
     else:
         target_dir = args.target_dir
     target_dir.mkdir(parents=True, exist_ok=True)
-    assert len(list(target_dir.glob("*"))) == 0, f"The model {repr(thing)} was requested for export into {target_dir} which is not empty!"
+    assert next(target_dir.iterdir(), None) is None, f"The model {repr(thing)} was requested for export into {target_dir} which is not empty!"
 
     graph.render(directory=target_dir)
 
@@ -7,21 +7,17 @@
 
         print(f"Fetching sketches objects for {self}")
 
-        def annotate_dict(olddict:Dict[str, bd.Sketch], annotation:str) -> Dict[str,bd.Sketch]:
-            """ Helper function that renames all element names, prepending a namespace-like annotation prefix. """
-            ret:Dict[str,bd.Sketch] = {}
-            for name, value in olddict.items():
-                assert isinstance(value, bd.Sketch)
-                ret[annotation + "_" + name] = value
-            return ret
-
-        ret = {}
-
-        for name, value in self.__dict__.items():
-            if isinstance(value, bd.Sketch):
-                ret[name] = value
-            elif isinstance(value, Thing):
-                ret.update(annotate_dict(value.get_sketches(), name))
+        ret:Dict[str,bd.Sketch] = {}
+
+        def collect(thing:Thing, prefix:str) -> None:
+            """ Stores the sketches of the thing and its sub-things directly in `ret`, prepending a namespace-like prefix to the names. """
+            for name, value in thing.__dict__.items():
+                if isinstance(value, bd.Sketch):
+                    ret[prefix + name] = value
+                elif isinstance(value, Thing):
+                    collect(value, prefix + name + "_")
+
+        collect(self, "")
 
         return ret
     @staticmethod
@@ -18,13 +18,9 @@ def fmt_scale(how:float):
         return f"{what * how:.4f}"
     return fmt_inner
 
-@singledispatch
 def fmt (sth:Any) -> str:
-    return str(sth)
-
-@fmt.register
-def _ (x:float) -> str:
-    return f"{x:.4f}"
+    """ Floats (including NumPy's) with four decimals, anything else as is. """
+    return f"{sth:.4f}" if isinstance(sth, float) else str(sth)
 
 NAMESPACE_SEPARATOR = ":"
 
@@ -36,6 +32,8 @@ def export(thing:Thing, target_dir:Path, fmt:str):
     thing_instance_counter:dict[int,int] = defaultdict(int)
     """ Lookup of already encountered Things; each Thing retains a count of how many times it is inthe design. """
 
+    target_dir.mkdir(exist_ok=True, parents=True)
+
     @singledispatch
     def process(joint:Any, name:str) -> None:
         raise NotImplementedError(f"Exporting type {type(joint)} to MJCF is not supported.")
@@ -52,7 +50,6 @@ def export(thing:Thing, target_dir:Path, fmt:str):
         mesh_name = thing.codename()
         res = thing.result()
         stl_file = target_dir / (mesh_name + "." + fmt)
-        stl_file.parent.mkdir(exist_ok=True, parents=True)
         if res is not None:
             if fmt == "stl":
                 res.export_stl(str(stl_file))
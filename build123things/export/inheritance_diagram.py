@@ -10,11 +10,14 @@ from pathlib import Path
 from typing import Any
 
 from build123d import Location
-from build123things import ORIG_INIT_REFERENCES, ReferenceTransformResolver, Thing, TransformResolver
+from build123things import DEBUG, ORIG_INIT_REFERENCES, ReferenceTransformResolver, Thing, TransformResolver
 import graphviz
 
 from build123things.materials import Material
 
+_SIGNATURE_CACHE:dict[type,inspect.Signature] = {}
+""" Signatures of the original constructors, which never change for a class; shared across exports. """
+
 def export(thing:type[Thing]) -> graphviz.Digraph:
     graph:graphviz.Digraph = graphviz.Digraph(
         name=f"Subassembly of {thing.__name__}",
@@ -58,11 +61,19 @@ def export(thing:type[Thing]) -> graphviz.Digraph:
         if cls is object or cls is ABC or cls is Thing: return
         name:str = cls.__name__
 
-        init = ORIG_INIT_REFERENCES[cls]
-        print()
+        if "inheritance_diagram.export" in DEBUG: print()
+        if name in type_store:
+            # NOTE: The node is already rendered, only the edge is missing.
+            if next_name is not None:
+                graph.edge(next_name, name)
+            return
+
+        signature = _SIGNATURE_CACHE.get(cls)
+        if signature is None:
+            signature = _SIGNATURE_CACHE[cls] = inspect.signature(ORIG_INIT_REFERENCES[cls])
 
         rows = []
-        for pname, pobj in inspect.signature(init).parameters.items():
+        for pname, pobj in signature.parameters.items():
             if pname == "self": continue
             if pobj.default is inspect._empty:
                 ddf = ""
@@ -96,14 +107,13 @@ def export(thing:type[Thing]) -> graphviz.Digraph:
             </TR>
             {"".join(rows)}
         </TABLE>>"""
-        if name not in type_store:
-            type_store[name] = cls
-            graph.node(name,label,attr)
+        type_store[name] = cls
+        graph.node(name,label,attr)
         if next_name is not None:
             graph.edge(next_name, name)
-        print(f"MRO: {cls.__mro__}")
+        if "inheritance_diagram.export" in DEBUG: print(f"MRO: {cls.__mro__}")
         for supercls in cls.__mro__[1:2]:
-            print(f"Export {supercls}")
+            if "inheritance_diagram.export" in DEBUG: print(f"Export {supercls}")
             process(supercls, name)
     process(thing, None)
     return graph
@@ -129,7 +139,7 @@ if __name__ == "__main__":
     else:
         target_dir = args.target_dir
     target_dir.mkdir(parents=True, exist_ok=True)
-    assert len(list(target_dir.glob("*"))) == 0, f"The model {repr(thing_cls)} was requested for export into {target_dir} which is not empty!"
+    assert next(target_dir.iterdir(), None) is None, f"The model {repr(thing_cls)} was requested for export into {target_dir} which is not empty!"
 
     graph.render(directory=target_dir)
 
@@ -13,32 +13,52 @@ from collections import defaultdict
 from pathlib import Path
 from typing import Any
 import build123d as bd
-import colored
-from build123things import Thing, TransformResolver
+import numpy as np
+import warnings
+from build123things import MOUNTING_LOCATION, Thing, TransformResolver
 from xml.etree.ElementTree import Element, ElementTree
 import xml.etree.ElementTree
 from functools import singledispatch
 from build123things.joints import Revolute, Rigid
 
-def fmt_scale(how:float):
-    def fmt_inner(what:float):
-        return f"{what * how:.4f}"
-    return fmt_inner
+def fmt_mm(xyz) -> str:
+    """ Formats a triplet in millimeters as a MuJoCo vector in meters. """
+    x, y, z = xyz
+    return f"{x * 0.001:.4f} {y * 0.001:.4f} {z * 0.001:.4f}"
 
-@singledispatch
-def fmt (sth:Any) -> str:
-    return str(sth)
+def fmt_triplet(xyz) -> str:
+    x, y, z = xyz
+    return f"{x:.4f} {y:.4f} {z:.4f}"
 
-@fmt.register
-def _ (x:float) -> str:
-    return f"{x:.4f}"
+def fmt (sth:Any) -> str:
+    """ Floats (including NumPy's) with four decimals, anything else as is. """
+    return f"{sth:.4f}" if isinstance(sth, float) else str(sth)
 
 NAMESPACE_SEPARATOR = ":"
 
 HACK_MINIMAL_INERTIA = "0.00001"
 
-def export(thing:Thing, target_dir:Path, mujoco_module:bool=False) -> ElementTree:
-    """ """
+HACK_MINIMAL_FULLINERTIA = " ".join(map(fmt, (HACK_MINIMAL_INERTIA, HACK_MINIMAL_INERTIA, HACK_MINIMAL_INERTIA, 0, 0, 0)))
+""" The `fullinertia` attribute of "empty" bodies, formatted once. """
+
+EMPTY_INERTIAL_ATTRS:dict[str,str] = {
+    "pos" : "0 0 0",
+    "mass" : HACK_MINIMAL_INERTIA, # NOTE: Hack to allow "empty" bodies.
+    "fullinertia" : HACK_MINIMAL_FULLINERTIA,
+}
+""" Attributes of the inertial element of "empty" bodies; `Element` copies them. """
+
+REVOLUTE_ATTRS:dict[str,str] = {
+    #"class":"NOT USED, I export all explicitly to the MJCF."
+    "type":"hinge",
+    "group":"0",
+    "axis" : "0 0 1",
+    "springdamper" : "0 0",
+}
+""" Attributes shared by all exported revolute joints; merged into a new dict and completed per joint. """
+
+def export(thing:Thing, target_dir:Path, mujoco_module:bool=False, fuse_rigid_components:bool=False) -> ElementTree:
+    """ If `fuse_rigid_components`, the rigidly mounted Things are put into the body of their parent as further geoms instead of nested bodies. """
 
     thing_instance_counter:dict[int,int] = defaultdict(int)
     """ Lookup of already encountered Things; each Thing retains a count of how many times it is inthe design. """
@@ -46,6 +66,12 @@ def export(thing:Thing, target_dir:Path, mujoco_module:bool=False) -> ElementTre
     thing_name_check_lookup:dict[str,int] = {}
     """ Just to ensure that multiple Things do not share the same name. """
 
+    thing_name_by_id:dict[int,str] = {}
+    """ The unique name assigned to each already encountered Thing. """
+
+    thing_name_next_suffix:dict[str,int] = defaultdict(int)
+    """ The last suffix used to tell apart Things sharing the same codename. """
+
     mesh_store:list[Element] = []
     """ Elements defining the meshes. """
 
@@ -55,41 +81,43 @@ def export(thing:Thing, target_dir:Path, mujoco_module:bool=False) -> ElementTre
     joint_name_unique_check:set[str] = set()
     """ Just to ensure two joints do not share the same name. """
 
+    assets_dir = target_dir / "assets"
+    assets_dir.mkdir(exist_ok=True, parents=True)
+
     @singledispatch
     def to_mjcf(joint:Any, name:str) -> Element:
         raise NotImplementedError(f"Exporting type {type(joint)} to MJCF is not supported.")
 
-    @to_mjcf.register
-    def _(thing:Thing, where:bd.Location)->Element:
-        """ Exports one Thing located w.r.t. some parent element. """
+    def register(thing:Thing) -> str:
+        """ Names the Thing uniquely, exports its mesh and material on the first encounter and counts its instances.
+        return: the generic name of the Thing, also used as the name of its mesh """
 
-        thing_name_generic = thing.codename()
+        thing_name_generic = thing_name_by_id.get(id(thing))
         """ How to call this Thing. """
 
-        # Check that the codename is unique
-        while thing_name_generic in thing_name_check_lookup and thing_name_check_lookup[thing_name_generic] != id(thing):
-            print(f"{colored.Back.YELLOW}{colored.Fore.RED}WARNING: {colored.Style.reset} Name {thing_name_generic} is not unique!")
-            thing_name_generic = thing_name_generic + "X"
-        else:
+        if thing_name_generic is None:
+            # Check that the codename is unique, otherwise number it.
+            codename = thing_name_generic = thing.codename()
+            while thing_name_generic in thing_name_check_lookup:
+                warnings.warn(f"Name {thing_name_generic} is not unique!")
+                thing_name_next_suffix[codename] += 1
+                thing_name_generic = f"{codename}_{thing_name_next_suffix[codename]}"
             thing_name_check_lookup[thing_name_generic] = id(thing)
+            thing_name_by_id[id(thing)] = thing_name_generic
 
         # Start with exporting the mesh.
-        mesh_name = thing_name_generic
         res = thing.result()
         if id(thing) not in thing_instance_counter:
-            stl_file = target_dir / "assets" / (thing_name_generic + ".stl")
-            stl_file.parent.mkdir(exist_ok=True, parents=True)
-            stl_name = stl_file.stem
+            stl_file = assets_dir / (thing_name_generic + ".stl")
             if res is not None:
                 res.scale(0.001).export_stl(str(stl_file))
                 mesh_store.append(Element("mesh", {
-                    "name":mesh_name,
+                    "name":thing_name_generic,
                     "file":str(stl_file.relative_to(target_dir))
                     }))
 
-        # Increment the counter, prepare further processing.
+        # Increment the counter.
         thing_instance_counter[id(thing)] += 1
-        thing_name_instance = f"{thing_name_generic}:{thing_instance_counter[id(thing)] - 1:03d}"
 
         # Export the material.
         material_name = thing.__material__.codename
@@ -100,67 +128,96 @@ def export(thing:Thing, target_dir:Path, mujoco_module:bool=False) -> ElementTre
                 rgba=" ".join(map(fmt, thing.__material__.color.rgba))
                 )
 
-        # Define the Thing itself.
-        link_element = Element("body", {
-            "name" : thing_name_instance,
-            #"childclass" : "???",
-            #"mocap" : "false",
-            "pos" : " ".join(map(fmt_scale(0.001), where.position)),
-            "euler" : " ".join(map(fmt, where.orientation)),
-            "gravcomp" : "0" ,
-            #"user" : "???" ,
-        })
+        return thing_name_generic
 
-        if res is not None:
-            # Export the dynamic properties.
+    def fill(thing:Thing, mesh_name:str, link_element:Element, name_prefix:str, offset:bd.Location|None, masses:list[tuple[float,Any]]) -> None:
+        """ Puts the geometry of the Thing and the Things mounted to it into the body.
+        The `offset` places a fused Thing within the body; it is None for the Thing the body was created for.
+        The masses and centers of gravity (in the body coordinates) of the Things put into the body are appended to `masses`. """
+
+        if thing.result() is not None:
+            # Collect the dynamic properties.
             inertia, com = thing.matrix_of_inertia()
-            inertial = Element("inertial", {
-                "pos" : " ".join(map(fmt_scale(0.001), com)),
-                #"euler" : "0 0 0",
-                "mass" : fmt(thing.mass()),
-                #"fullinertia" : " ".join(map(fmt, (inertia[0,0], inertia[1,1], inertia[2,2], inertia[0,1], inertia[0,2], inertia[1,2]))),
-            })
-            link_element.append(inertial)
+            if offset is not None:
+                # NOTE: The center of gravity is in meters, the locations in millimeters.
+                com = (offset * bd.Location(tuple(c * 1000 for c in com))).position * 0.001
+            masses.append((thing.mass(), com))
 
             # Export the geometry.
             geom = Element("geom", {
                 #"name": "full_body",
                 #"class": "default_build123things_stl",
                 "type": "mesh",
-                "material": material_name,
+                "material": thing.__material__.codename,
                 "mesh": mesh_name,
                 })
+            if offset is not None:
+                geom.set("pos", fmt_mm(offset.position))
+                geom.set("euler", fmt_triplet(offset.orientation))
 
             link_element.append(geom)
-        else:
-            inertial = Element("inertial", {
-                "pos" : "0 0 0",
-                "mass" : HACK_MINIMAL_INERTIA,
-                "fullinertia" : " ".join(map(fmt, (HACK_MINIMAL_INERTIA, HACK_MINIMAL_INERTIA, HACK_MINIMAL_INERTIA, 0, 0, 0))),
-            })
-            link_element.append(inertial)
 
         # Now export other Things.
         for mounted_as, transform_resolver in thing.enumerate_assembly():
             assert isinstance(mounted_as, str)
             assert isinstance(transform_resolver, TransformResolver)
             if isinstance(transform_resolver._joint, Rigid):
-                link_element.append(to_mjcf(transform_resolver._wrapped, transform_resolver.transform))
+                where = transform_resolver.transform if offset is None else offset * transform_resolver.transform
+                if fuse_rigid_components:
+                    wrapped = transform_resolver._wrapped
+                    fill(wrapped, register(wrapped), link_element, f"{name_prefix}:{mounted_as}", where, masses)
+                else:
+                    link_element.append(to_mjcf(transform_resolver._wrapped, where))
             else:
+                where = transform_resolver._orig_mount.location if offset is None else offset * transform_resolver._orig_mount.location
                 intermediate_link = Element("body",
-                    name=f"{thing_name_instance}:{mounted_as}",
-                    pos=" ".join(map(fmt_scale(0.001), transform_resolver._orig_mount.location.position)),
-                    euler=" ".join(map(fmt, transform_resolver._orig_mount.location.orientation)),
+                    name=f"{name_prefix}:{mounted_as}",
+                    pos=fmt_mm(where.position),
+                    euler=fmt_triplet(where.orientation),
                 )
-                inertial = Element("inertial", {
-                    "pos" : "0 0 0",
-                    "mass" : HACK_MINIMAL_INERTIA, # NOTE: Hack to allow "empty" bodies.
-                    "fullinertia" : " ".join(map(fmt, (HACK_MINIMAL_INERTIA, HACK_MINIMAL_INERTIA, HACK_MINIMAL_INERTIA, 0, 0, 0))),
-                })
-                intermediate_link.append(inertial)
-                intermediate_link.append(to_mjcf(transform_resolver._joint, f"{thing_name_instance}:{mounted_as}"))
-                intermediate_link.append(to_mjcf(transform_resolver._wrapped, bd.Location((0,0,0),(180,0,90)) * transform_resolver._next_mount.location.inverse())) # type: ignore
+                intermediate_link.append(Element("inertial", EMPTY_INERTIAL_ATTRS))
+                intermediate_link.append(to_mjcf(transform_resolver._joint, f"{name_prefix}:{mounted_as}"))
+                intermediate_link.append(to_mjcf(transform_resolver._wrapped, MOUNTING_LOCATION * transform_resolver._next_mount.location.inverse())) # type: ignore
                 link_element.append(intermediate_link)
+
+    @to_mjcf.register
+    def _(thing:Thing, where:bd.Location)->Element:
+        """ Exports one Thing located w.r.t. some parent element. """
+
+        thing_name_generic = register(thing)
+        thing_name_instance = f"{thing_name_generic}:{thing_instance_counter[id(thing)] - 1:03d}"
+
+        # Define the Thing itself.
+        link_element = Element("body", {
+            "name" : thing_name_instance,
+            #"childclass" : "???",
+            #"mocap" : "false",
+            "pos" : fmt_mm(where.position),
+            "euler" : fmt_triplet(where.orientation),
+            "gravcomp" : "0" ,
+            #"user" : "???" ,
+        })
+
+        masses:list[tuple[float,Any]] = []
+        fill(thing, thing_name_generic, link_element, thing_name_instance, None, masses)
+
+        # Export the dynamic properties, the fused Things included.
+        if len(masses) == 0:
+            inertial = Element("inertial", EMPTY_INERTIAL_ATTRS)
+        else:
+            if len(masses) == 1:
+                mass, com = masses[0]
+            else:
+                mass = sum(m for m, _ in masses)
+                com = sum(np.asarray(tuple(c)) * m for m, c in masses) / mass
+            inertial = Element("inertial", {
+                "pos" : fmt_mm(com),
+                #"euler" : "0 0 0",
+                "mass" : fmt(mass),
+                #"fullinertia" : " ".join(map(fmt, (inertia[0,0], inertia[1,1], inertia[2,2], inertia[0,1], inertia[0,2], inertia[1,2]))),
+            })
+        link_element.insert(0, inertial)
+
         return link_element
 
     @to_mjcf.register
@@ -170,20 +227,14 @@ def export(thing:Thing, target_dir:Path, mujoco_module:bool=False) -> ElementTre
         assert name not in joint_name_unique_check
         joint_name_unique_check.add(name)
 
-        joint_element = Element("joint", {
-            "name": name,
-            #"class":"NOT USED, I export all explicitly to the MJCF."
-            "type":"hinge",
-            "group":"0",
-            #"pos" : " ".join(map(fmt_scale(0.001), joint.stator_mount.position)),
-            "axis" : "0 0 1",
-            "springdamper" : "0 0",
-            "limited" : "false" if joint.limit_angle is None else "true",
-            "range" : "0 0" if joint.limit_angle is None else " ".join(map(fmt, joint.limit_angle)),
-            "actuatorfrclimited" : "false" if joint.limit_effort is None else "true",
-            "actuatorfrcrange" : "0 0" if joint.limit_effort is None else f"0 {fmt(joint.limit_effort)}",
-            # TODO: Implement more of joint dynamics
-            })
+        attrs = {"name": name, **REVOLUTE_ATTRS}
+        #attrs["pos"] = fmt_mm(joint.stator_mount.position)
+        attrs["limited"] = "false" if joint.limit_angle is None else "true"
+        attrs["range"] = "0 0" if joint.limit_angle is None else " ".join(map(fmt, joint.limit_angle))
+        attrs["actuatorfrclimited"] = "false" if joint.limit_effort is None else "true"
+        attrs["actuatorfrcrange"] = "0 0" if joint.limit_effort is None else f"0 {fmt(joint.limit_effort)}"
+        # TODO: Implement more of joint dynamics
+        joint_element = Element("joint", attrs)
         return joint_element
 
     # Convert the Thing to xml.
@@ -233,6 +284,7 @@ if __name__ == "__main__":
     argp.add_argument("--param-file", "-p", default=None, type=Path, help="Yaml file containing args and kwargs to pass to thing constructor. Expects two documents (separated by ---) in the file, the first with array (args) and the second with dict (kwargs).")
     argp.add_argument("--target-dir", "-d", default=None, type=Path, help="Target directory.")
     argp.add_argument("--worldbody", "-w", action="store_true", help="Export as self-standing MuJoCo model with the worldbody element and simulation stubs. (If absent, a MuJoCo embeddable )")
+    argp.add_argument("--fuse-rigid", "-f", action="store_true", help="Put rigidly mounted Things into the body of their parent instead of nested bodies.")
     argp.add_argument("--empty-elements-fmt", "-e", type=str, choices=EMPTY_ELEMENTS_FMT_LOOKUP.keys(), default="short")
     args = argp.parse_args()
 
@@ -249,7 +301,7 @@ if __name__ == "__main__":
         target_dir:Path = args.target_dir
     target_dir.mkdir(parents=True, exist_ok=True)
 
-    etree = export(thing, target_dir, not args.worldbody)
+    etree = export(thing, target_dir, not args.worldbody, args.fuse_rigid)
     xml.etree.ElementTree.indent(etree)
     etree.write(target_dir / "robot.mjcf", xml_declaration=True, short_empty_elements=EMPTY_ELEMENTS_FMT_LOOKUP[args.empty_elements_fmt])
 
@@ -17,16 +17,28 @@ import graphviz
 from build123things.materials import Material
 
 def export(thing:Thing):
+    """ Counts how many times each Thing appears in the assembly.
+    Each distinct Thing is expanded only once, its count is then pushed down to its subassembly in topological order. """
+    children:dict[Thing,list[Thing]] = {}
+    order:list[Thing] = []
+    stack:list[tuple[Thing,bool]] = [(thing, False)]
+    while stack:
+        t, expanded = stack.pop()
+        if expanded:
+            order.append(t)
+            continue
+        if t in children:
+            continue
+        children[t] = [v.wrapped for _, v in t.enumerate_assembly()]
+        stack.append((t, True))
+        stack.extend((c, False) for c in children[t] if c not in children)
+
     counter = defaultdict(int)
-    total = 0
-    def process(t:Thing) -> None:
-        nonlocal total
-        counter[t] += 1
-        total += 1
-        for _, v in t.enumerate_assembly():
-            process(v.wrapped)
-    process(thing)
-    return total, counter
+    counter[thing] = 1
+    for t in reversed(order):
+        for c in children[t]:
+            counter[c] += counter[t]
+    return sum(counter.values()), counter
 
 if __name__ == "__main__":
     import argparse
@@ -45,7 +57,7 @@ if __name__ == "__main__":
     else:
         raise NotImplementedError("TODO: Parse the yaml and instantiate.")
 
-    pprint(Thing.list_of_all_existing_things)
+    pprint(list(Thing.list_of_all_existing_things))
     print(f"Total {len(Thing.list_of_all_existing_things)} unique components used in assembly or for reference.")
 
     total, counter = export(thing)
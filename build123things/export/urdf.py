@@ -19,10 +19,19 @@ import numpy as np
 
 NAMESPACE_SEPARATOR = ":"
 
-def export_as_robot(thing:Thing, file:str|Path|IO, short_empty_elements:bool=True, fuse_rigid_components:bool = True) -> None:
+def export_as_robot(thing:Thing, file:str|Path|IO, short_empty_elements:bool=True, fuse_rigid_components:bool = True, target_dir:Path|None = None) -> None:
+    """ The meshes are written to `target_dir`, which defaults to the directory of `file` if given by a path and to `build` otherwise. """
+    if target_dir is None:
+        target_dir = Path(file).parent if isinstance(file, (str, Path)) else Path("build")
+    target_dir.mkdir(parents=True, exist_ok=True)
+
     store_links = []
     store_joints:List[Element] = []
     store_materials = []
+    store_meshes:dict[int,str] = {}
+    """ STL file names of the already exported Things; a Thing used in several links is meshed only once. """
+    stl_fnames_used:set[str] = set()
+    """ Just to ensure that two Things do not share the same STL file. """
 
     def process_link(thing:Thing, thing_name:str, precision:int=3):
         """ The function incrementally builds the XML element tree. The function returns the name of the given component. """
@@ -38,28 +47,41 @@ def export_as_robot(thing:Thing, file:str|Path|IO, short_empty_elements:bool=Tru
                 # Now I can proceed with exporting the child link, already moved to the joint-local coordinates as required by the URDF.
                 process_link(motor.reference_thing, f"{child_link_prefix}{motor_name}")
 
-        stl_fname = thing_name + ".stl"
-        thing.result().export_stl("build/" + stl_fname)
+        stl_fname = store_meshes.get(id(thing))
+        if stl_fname is None:
+            stl_fname = thing.codename() + ".stl"
+            suffix = 0
+            while stl_fname in stl_fnames_used:
+                suffix += 1
+                stl_fname = f"{thing.codename()}_{suffix}.stl"
+            stl_fnames_used.add(stl_fname)
+            store_meshes[id(thing)] = stl_fname
+            thing.result().export_stl(str(target_dir / stl_fname))
 
         inertia, com = thing.matrix_of_inertia()
+        # NOTE: All the numbers of the inertial are formatted by a single call.
+        ixx, ixy, ixz, iyy, iyz, izz, com_x, com_y, com_z, mass = np.char.mod(f"%.{precision}f", np.array((
+            inertia[0,0], inertia[0,1], inertia[0,2], inertia[1,1], inertia[1,2], inertia[2,2],
+            com[0], com[1], com[2], thing.mass()
+        ))).tolist()
         element = Element("link", {
             "name" : thing_name
         })
 
         inertial = Element("inertial")
         inertial.append(Element("origin", {
-            "xyz" : f"{com[0]:.{precision}f} {com[1]:.{precision}f} {com[2]:.{precision}f}"
+            "xyz" : f"{com_x} {com_y} {com_z}"
         }))
         inertial.append(Element("mass", {
-            "value" : f"{thing.mass():.{precision}f}"
+            "value" : mass
         }))
         inertial.append(Element("inertia", {
-            "ixx" : f"{inertia[0,0]:.{precision}f}",
-            "ixy" : f"{inertia[0,1]:.{precision}f}",
-            "ixz" : f"{inertia[0,2]:.{precision}f}",
-            "iyy" : f"{inertia[1,1]:.{precision}f}",
-            "iyz" : f"{inertia[1,2]:.{precision}f}",
-            "izz" : f"{inertia[2,2]:.{precision}f}",
+            "ixx" : ixx,
+            "ixy" : ixy,
+            "ixz" : ixz,
+            "iyy" : iyy,
+            "iyz" : iyz,
+            "izz" : izz,
         }))
         element.append(inertial)
 
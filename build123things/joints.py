@@ -44,11 +44,11 @@ class Revolute(build123things.AbstractJoint):
         super().__init__(stator, rotor, peers)
 
     def transform(self, mount_static: build123things.MountPoint, mount_aligned: build123things.MountPoint) -> bd.Location:
-        t:bd.Location = bd.Location((0,0,0), (0,0,self.__param_kwargs__["alpha"]))
-        if mount_static is self.reference_mount and mount_aligned is self.moving_mount:
-            return t
-        elif mount_static is self.moving_mount and mount_aligned is self.reference_mount:
-            return t.inverse()
+        direction = self._which(mount_static) * 2 + self._which(mount_aligned)
+        if direction == 1: # NOTE: reference -> moving
+            return bd.Location((0,0,0), (0,0,self.__param_kwargs__["alpha"]))
+        elif direction == 2: # NOTE: moving -> reference
+            return bd.Location((0,0,0), (0,0,-self.__param_kwargs__["alpha"]))
         else:
             raise ValueError
 
@@ -3,7 +3,22 @@ import build123things.colors
 from build123things.colors import Color
 from typing import Any, Union
 
-class Material:
+_DEFAULT_INSTANCES:dict[type,"Material"] = {}
+""" The default-constructed instance of each Material class. """
+
+class MaterialMeta (type):
+    """ Interns the default-constructed Materials, so that e.g. `PETG()` returns the same instance every time.
+    Materials constructed with any arguments are created anew as usual. """
+
+    def __call__(cls, *args: Any, **kwds: Any) -> Any:
+        if args or kwds:
+            return super().__call__(*args, **kwds)
+        ret = _DEFAULT_INSTANCES.get(cls)
+        if ret is None:
+            ret = _DEFAULT_INSTANCES[cls] = super().__call__()
+        return ret
+
+class Material (metaclass=MaterialMeta):
     """ Defines the Thing's embodiment. Currently, this means that it stores values for
     - Density
     - Color
@@ -14,41 +29,34 @@ class Material:
     - Roughness and such (which would be nice research topic, but related to Thing learning.)
 
     Note that the Thing defines the geometry and semantics of component hierarchy; this class serves as a codified Material annotation.
+    The default-constructed instances are shared (see `MaterialMeta`), do not alter them.
     """
 
+    __slots__ = ("density", "color", "__owner__")
+
     def __init__(self, density:float, color:None | Color) -> None:
         self.__owner__:Any
         """ The owner is set automatically via Thing's __setattr__ mechanism.
         This declaration is for type hinting only. """
-        setattr(self, "density", density)
-        setattr(self, "color", color)
 
-    @property
-    def density (self):
+        if type(density) is not float:
+            # NOTE: The exact type check above lets the usual floats through at once.
+            if isinstance(density, int):
+                density = float(density)
+            elif not isinstance(density, float):
+                raise TypeError(f"Density has to be a number, got {type(density)}.")
+        if density != density:
+            density = 0.0
+        if density < 0.0 or density == float("inf"):
+            raise ValueError(f"Density has to be non-negative and finite, got {density}.")
+        self.density:float = density
         """ Density in SI units kilograms per cubic meter. If set to `NaN`, the material is considered mass-less, the same as if set to zero. Negative and infinite values are rejected. """
-        return self.__dict__["__density__"]
-
-    @density.setter
-    def density (self, value:float):
-        if isinstance(value, int):
-            value = float(value)
-        assert isinstance(value, float)
-        if value == float("NaN"):
-            value = 0.0
-        assert value >= 0.0 and value != float("inf")
-        self.__dict__["__density__"] = value
 
-    @property
-    def color (self):
+        #assert isinstance(color, build123things.colors.Color) or color is None
+        if color is None:
+            color = build123things.colors.Color(0,0,0,1)
+        self.color:Color = color
         """ A color or None, if the Material is not to be rendered at all. """
-        return self.__dict__["__color__"]
-
-    @color.setter
-    def color (self, value:Union[build123things.colors.Color, None]):
-        #assert isinstance(value, build123things.colors.Color) or value is None
-        if value is None:
-            value = build123things.colors.Color(0,0,0,1)
-        self.__dict__["__color__"] = value
 
     @property
     def codename(self) -> str:
@@ -56,32 +64,39 @@ class Material:
 
 class Aether (Material):
     """ A material which is not a material in fact. It is used to annotate Joints. """
+    __slots__ = ()
     def __init__(self) -> None:
         super().__init__(density = 0, color = None)
 
 class MixedMaterial (Material):
+    __slots__ = ()
     def __init__(self) -> None:
         warnings.warn("The PETG density is a guess. Fix me.")
         super().__init__(density= 0, color=build123things.colors.AQUA)
 
 class Steel (Material):
+    __slots__ = ()
     def __init__(self, color=build123things.colors.STEELBLUE) -> None:
         super().__init__(density=7800.0, color=color)
 
 class Rubber (Material):
+    __slots__ = ()
     def __init__(self, color=build123things.colors.BURLYWOOD) -> None:
         super().__init__(density=800.0, color=color)
 
 class Brass (Material):
+    __slots__ = ()
     def __init__(self, color=build123things.colors.ORANGERED3) -> None:
         super().__init__(density=8500, color=color)
 
 class PETG (Material):
+    __slots__ = ()
     # TODO: Allow passing print properites
     def __init__(self, color:Color=build123things.colors.LAVENDER) -> None:
         super().__init__(density=1230, color=color)
 
 class PCB (Material):
+    __slots__ = ()
     def __init__(self, color=build123things.colors.GREEN1) -> None:
         super().__init__(density=1000, color=color)
 
@@ -2,75 +2,148 @@
 
 from abc import ABCMeta
 import argparse
+from collections import OrderedDict
+import functools
 from typing import Callable, Any, Dict, NoReturn, Set
 import build123d as bd
 from colored import Fore, Style
 import build123things
+from build123things import _typed_key
 from pprint import pformat, pprint
 import copy
 from random import choices
 import string
 from pathlib import Path
 import inspect
+import linecache
+import sys
+import time
+import weakref
 
 DEBUG:Set[str] = set()
 #DEBUG.add("memoize")
-MEMOIZATION_CACHE = dict()
+MEMOIZATION_CACHE:OrderedDict = OrderedDict()
+""" The shared cache of `memoize`, ordered from the least recently used. """
+MEMOIZATION_CACHE_SIZE:int = 4096
+""" The number of entries a memoization cache keeps before evicting the least recently used ones. """
+MEMOIZATION_PROFILED_CALLS:int = 8
+""" How many calls of an adaptively memoized function are timed before deciding whether caching it pays off. """
+MEMOIZATION_MIN_COST_NS:int = 5000
+""" Functions cheaper than this on average (in nanoseconds) are not worth a cache lookup and are called directly. """
+MEMOIZATION_STATS:weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+""" The number of timed calls and their total duration in nanoseconds, per adaptively memoized function. """
 
 def random_tmp_fname(ext:str, where:str="/tmp/", k:int=10, alphabet:str=string.ascii_uppercase + string.digits):
-    return where + ''.join(choices(alphabet, k=10)) + ext
+    return f"{where}{''.join(choices(alphabet, k=k))}{ext}"
 
-def memoize(fnc_orig:Callable):
-    # TODO: Replace with functools.cache? It would require all objects hashable, which I do not thing is going to happen.
-    # If so, then import as memoize for compatibility. Or maybe combine hash if possible with repr or id by default.
+_MISSING = object()
+""" Marks a missing entry of the memoization cache; None is a legit cached value. """
+
+def memoize(fnc_orig:Callable, cache:OrderedDict|None=None, adaptive:bool=False):
+    """ Caches the results of the function keyed by its arguments.
+    Hashable arguments are keyed as they are, unhashable ones by their textual representation.
+    With `adaptive`, the first few calls are timed and a function cheaper than the lookup itself is called directly from then on; otherwise the results are always cached, as callers may rely on getting the identical object.
+    With "memoize" in DEBUG at the time of decoration, the calls are traced.
+    The results go to the shared `MEMOIZATION_CACHE` unless a dedicated `cache` is given, e.g. by `functools.partial(memoize, cache=OrderedDict())`, which can be dropped as a whole. """
+    if cache is None:
+        cache = MEMOIZATION_CACHE
+    stats:list|None = None
+    """ The profile of the function, kept only when memoizing adaptively. """
+    if adaptive:
+        stats = MEMOIZATION_STATS[fnc_orig] = [0, 0]
+    bypass = False
+    """ Set once the function proved cheaper than its caching. """
+    misses = 0
+    """ The number of calls not served from the cache. """
     def memoized(*args, **kwargs):
-        #signature = tuple([a.__hash__() for a in args] + [a.__hash__() for a in kwargs.keys()] + [a.__hash__() for a in kwargs.values()]).__hash__()
-        signature = str(args) + str(kwargs)
-        if signature not in MEMOIZATION_CACHE:
-            MEMOIZATION_CACHE[signature] = fnc_orig(*args, **kwargs)
-            fire = True
-        else:
-            fire = False
-        ret = MEMOIZATION_CACHE[signature]
-        if "memoize" in DEBUG:
-            if not fire:
-                #print(f"{Fore.light_green}{Style.bold}MEMOIZATION RETRIEVED CACHED value {Fore.cyan} {repr(ret)}{Style.reset}. Fnc. signature: ", signature)
-                print(f"{Fore.light_green}{Style.bold}MEMOIZATION RETRIEVED CACHED value {Fore.cyan} {repr(ret)}{Style.reset}.")
-                try:
-                    code_context = inspect.stack()[1].code_context[0].strip()[:100] # type: ignore
-                except:
-                    code_context = "<code context not available>"
-                print(f" {Fore.rgb(100,100,100)}\\_> ...{inspect.stack()[1].filename[-20:]}:{inspect.stack()[1].lineno}   {code_context}{Style.reset}")
+        nonlocal bypass, misses
+        if bypass:
+            misses += 1
+            return fnc_orig(*args, **kwargs)
+        # NOTE: Keyword arguments are sorted so that their order in the call does not matter. The values are typed so that e.g. 1, 1.0 and True get distinct entries.
+        kwitems = tuple((k, _typed_key(v)) for k, v in sorted(kwargs.items())) if kwargs else ()
+        try:
+            signature:Any = (fnc_orig, _typed_key(args), kwitems)
+            ret = cache.get(signature, _MISSING)
+        except TypeError:
+            # NOTE: Unhashable arguments, fall back to the textual key. Keying by ids would alias once an argument is collected or mutated.
+            signature = (fnc_orig, str(_typed_key(args)) + str(kwitems))
+            ret = cache.get(signature, _MISSING)
+        if ret is _MISSING:
+            misses += 1
+            if stats is not None and stats[0] < MEMOIZATION_PROFILED_CALLS:
+                start = time.perf_counter_ns()
+                ret = fnc_orig(*args, **kwargs)
+                stats[0] += 1
+                stats[1] += time.perf_counter_ns() - start
+                if stats[0] == MEMOIZATION_PROFILED_CALLS and stats[1] < MEMOIZATION_MIN_COST_NS * stats[0]:
+                    bypass = True
             else:
-                #print(f"{Fore.light_red}{Style.bold}MEMOIZATION FAILED. Fnc. signature: {Style.reset}", signature)
-                print(f"{Fore.light_red}{Style.bold}MEMOIZATION FAILED.")
-                #print(f" ... Available signatures: ")
-                #pprint(cache)
-                try:
-                    code_context = inspect.stack()[1].code_context[0].strip()[:100] # type: ignore
-                except:
-                    code_context = "<code context not available>"
-                print(f" {Fore.rgb(100,100,100)}\\_> ...{inspect.stack()[1].filename[-20:]}:{inspect.stack()[1].lineno}   {code_context}{Style.reset}")
+                ret = fnc_orig(*args, **kwargs)
+            cache[signature] = ret
+            while len(cache) > MEMOIZATION_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(signature)
         return ret
-    return memoized
+
+    if "memoize" not in DEBUG:
+        return memoized
+
+    # NOTE: Debugging was requested when the function got decorated; only then the calls are traced.
+    name = fnc_orig.__qualname__
+    def memoized_debug(*args, **kwargs):
+        misses_before = misses
+        ret = memoized(*args, **kwargs)
+        if misses == misses_before:
+            #print(f"{Fore.light_green}{Style.bold}MEMOIZATION RETRIEVED CACHED value {Fore.cyan} {repr(ret)}{Style.reset}. Fnc. signature: ", signature)
+            print(f"{Fore.light_green}{Style.bold}MEMOIZATION OF {name} RETRIEVED CACHED value {Fore.cyan} {repr(ret)}{Style.reset}.")
+        else:
+            #print(f"{Fore.light_red}{Style.bold}MEMOIZATION FAILED. Fnc. signature: {Style.reset}", signature)
+            print(f"{Fore.light_red}{Style.bold}MEMOIZATION OF {name} FAILED.")
+        caller = sys._getframe(1)
+        code_context = linecache.getline(caller.f_code.co_filename, caller.f_lineno).strip()[:100] or "<code context not available>"
+        print(f" {Fore.rgb(100,100,100)}\\_> ...{caller.f_code.co_filename[-20:]}:{caller.f_lineno}   {code_context}{Style.reset}")
+        return ret
+    return memoized_debug
+
+def _memoize_clear() -> None:
+    """ Empties the shared memoization cache. """
+    MEMOIZATION_CACHE.clear()
+
+def _memoize_resize(size:int) -> None:
+    """ Sets the number of entries kept by the memoization caches, evicting the least recently used entries of the shared one right away. """
+    global MEMOIZATION_CACHE_SIZE
+    assert size > 0
+    MEMOIZATION_CACHE_SIZE = size
+    while len(MEMOIZATION_CACHE) > MEMOIZATION_CACHE_SIZE:
+        MEMOIZATION_CACHE.popitem(last=False)
+
+memoize.clear = _memoize_clear # type: ignore
+memoize.resize = _memoize_resize # type: ignore
+
+NEIGHBOURHOOD_4_MAIN = ((1,0),(-1,0),(0,1),(0,-1))
+NEIGHBOURHOOD_4_DIAG = ((1,1),(-1,1),(1,-1),(-1,-1))
+NEIGHBOURHOOD_8 = NEIGHBOURHOOD_4_DIAG + NEIGHBOURHOOD_4_MAIN
 
 def neighbourhood_4_main():
-    for i in ((1,0),(-1,0),(0,1),(0,-1)):
-        yield i
+    return NEIGHBOURHOOD_4_MAIN
 
 def neighbourhood_4_diag():
-    for i in ((1,1),(-1,1),(1,-1),(-1,-1)):
-        yield i
+    return NEIGHBOURHOOD_4_DIAG
 
 def neighbourhood_8():
-    for g in (neighbourhood_4_diag() , neighbourhood_4_main()):
-        for i in g:
-            yield i
+    return NEIGHBOURHOOD_8
 
 class CQEditAwareArgumentParser(argparse.ArgumentParser):
     def error(self, msg):
         if not "show_object" in globals().keys():
             raise SystemExit(msg)
 
+@functools.cache
 def is_in_cq_editor() -> bool:
-    return Path(inspect.stack()[-1].filename).stem == "cq-editor"
+    """ Whether the outermost frame is the cq-editor's script; this never changes during the process. """
+    frame = sys._getframe()
+    while frame.f_back is not None:
+        frame = frame.f_back
+    return Path(frame.f_code.co_filename).stem == "cq-editor"
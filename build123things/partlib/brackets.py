@@ -4,9 +4,10 @@
 This file contains fixtures to attach two Dynamixel servos together. Some of the codes are very ugly!
 """
 
+import functools
 from math import sqrt
 import build123d as bd
-from build123things import MountPoint, ReferenceTransformResolver, Thing
+from build123things import MOUNTING_LOCATION, MountPoint, ReferenceTransformResolver, Thing
 from build123things.joints import Rigid
 from build123things.materials import PETG
 from build123things.partlib.dynamixel import XM430, XM540
@@ -27,7 +28,7 @@ class BracketRotorBody (Thing):
         self.servo_by_rotor_ref = servo_by_rotor_ref
 
         loc_rotor:bd.Location = servo_by_rotor_ref.rotor_sketch.location
-        self.mount_rotor:MountPoint = MountPoint(loc_rotor * bd.Location((0,0,0),(180,0,90)))
+        self.mount_rotor:MountPoint = MountPoint(loc_rotor * MOUNTING_LOCATION)
         self.sketch_attach_rotor:bd.Sketch = bd.Sketch() + loc_rotor * (
             bd.Circle(radius=25/2) +
             bd.Rectangle(width=25,height=25/2,align=(bd.Align.CENTER,bd.Align.MIN)) -
@@ -54,7 +55,8 @@ class BracketRotorBody (Thing):
         self.servo_by_rotor_ref_screw_6 = servo_by_rotor_ref.screw_rotor_row1_6()
         self.servo_by_rotor_ref_screw_7 = servo_by_rotor_ref.screw_rotor_row1_7()
 
-        for ref in [self.servo_by_body_ref_screw_1,
+        # NOTE: All the screw holes are cut by a single boolean operation.
+        a -= [ref.result() for ref in [self.servo_by_body_ref_screw_1,
                     self.servo_by_body_ref_screw_2,
                     self.servo_by_body_ref_screw_3,
                     self.servo_by_body_ref_screw_4,
@@ -65,11 +67,10 @@ class BracketRotorBody (Thing):
                     self.servo_by_rotor_ref_screw_4,
                     self.servo_by_rotor_ref_screw_5,
                     self.servo_by_rotor_ref_screw_6,
-                    self.servo_by_rotor_ref_screw_7]:
-            a -= ref.result()
+                    self.servo_by_rotor_ref_screw_7]]
 
         loc_body:bd.Location = servo_by_body_ref.right.location
-        self.mount_body:MountPoint = MountPoint(loc_body * bd.Location((0,0,0),(180,0,90)))
+        self.mount_body:MountPoint = MountPoint(loc_body * MOUNTING_LOCATION)
         self.sketch_attach_body:bd.Sketch = bd.Sketch() + loc_body * (
             bd.Rectangle(width=25,height=40) -
             bd.Rectangle(width=10,height=15)
@@ -93,6 +94,31 @@ class BracketRotorBody (Thing):
     def mass(self, recurse=False) -> float:
         return 0.006 # Measured 2024-02-07
 
+@functools.lru_cache(maxsize=64)
+def _make_sketch_face(primary_radius_outer:float, primary_radius_inner:float, height:float) -> bd.Sketch:
+    """ The primary plane of `BracketRotor`. Shared among the brackets of the same dimensions, do not alter it. """
+    return bd.Sketch() + \
+        bd.Circle(radius=primary_radius_outer) + \
+        bd.Rectangle(height=height, width=2*primary_radius_outer, align=(bd.Align.CENTER, bd.Align.MAX)) - \
+        bd.Circle(radius=primary_radius_inner) - \
+        bd.make_face(bd.Polyline( # type: ignore
+            (-primary_radius_inner,0),
+            (-primary_radius_inner-2,3),
+            (-8,4),
+            (-primary_radius_outer,4),
+            (-primary_radius_outer,30),
+            (+primary_radius_outer,30),
+            (+primary_radius_outer,4),
+            (+8,4),
+            (+primary_radius_inner+2,3),
+            (+primary_radius_inner,0),
+            ))
+
+@functools.cache
+def _make_sketch_body_cable() -> bd.Sketch:
+    """ The cable passage through the secondary plane of `BracketRotor`. Shared among all the brackets, do not alter it. """
+    return bd.Sketch() + bd.Rectangle(width=13,height=4.5) + bd.Rectangle(width=4.5,height=13)
+
 class BracketRotor (Thing):
     """ A part which attaches to a bearing and a rotor (primary plane) and provides attachment facilities (secondary plane).
 
@@ -127,57 +153,57 @@ class BracketRotor (Thing):
         primary_radius_outer = servo.p.rotor_radius_1 + 1.5 # type: ignore
         primary_radius_inner = servo.p.rotor_radius_2+primary_rotor_clearance # type: ignore
 
-        primary_span = abs(servo.rotor_sketch.location.position.Z - servo.bearing_sketch.location.position.Z)
+        rotor_loc = servo.rotor_sketch.location
+        bearing_loc = servo.bearing_sketch.location
+
+        primary_span = abs(rotor_loc.position.Z - bearing_loc.position.Z)
         """ The distance between primary planes. """
         print(f"primary_span = {primary_span}")
 
-        self.mount_a = MountPoint(servo.rotor_sketch.location * bd.Location((0,0,0),(180,0,90)))
+        mount_a_loc = rotor_loc * MOUNTING_LOCATION
+        self.mount_a = MountPoint(mount_a_loc)
         """ A rotor or bearing can be attached here. """
 
-        self.mount_b = MountPoint(servo.bearing_sketch.location * bd.Location((0,0,0),(180,0,-90)))
+        mount_b_loc = bearing_loc * bd.Location((0,0,0),(180,0,-90))
+        self.mount_b = MountPoint(mount_b_loc)
         """ A rotor or bearing can be attached here. """
 
         secondary_base = bd.Location((0, clearance, 0), (-90,0,0))
         """ Extrusion base for the secondary plane. """
 
-        self.mount_c = MountPoint(secondary_base * bd.Location((0,0,secondary_thickness/2 if secondary_allow_counterfit else secondary_thickness)))
+        mount_c_loc = secondary_base * bd.Location((0,0,secondary_thickness/2 if secondary_allow_counterfit else secondary_thickness))
+        self.mount_c = MountPoint(mount_c_loc)
         """ Another bracket or a different part may be attached here. """
 
-        sketch_face = bd.Sketch() + \
-            bd.Circle(radius=primary_radius_outer) + \
-            bd.Rectangle(height=clearance+secondary_thickness, width=2*primary_radius_outer, align=(bd.Align.CENTER, bd.Align.MAX)) - \
-            bd.Circle(radius=primary_radius_inner) - \
-            bd.make_face(bd.Polyline( # type: ignore
-                (-primary_radius_inner,0),
-                (-primary_radius_inner-2,3),
-                (-8,4),
-                (-primary_radius_outer,4),
-                (-primary_radius_outer,30),
-                (+primary_radius_outer,30),
-                (+primary_radius_outer,4),
-                (+8,4),
-                (+primary_radius_inner+2,3),
-                (+primary_radius_inner,0),
-                ))
+        sketch_face = _make_sketch_face(primary_radius_outer, primary_radius_inner, clearance+secondary_thickness)
 
         sketch_body = secondary_base * (bd.Sketch() + bd.Rectangle(height=primary_span+primary_thickness*2 , width=2*primary_radius_outer))
-        sketch_body_cross = self.mount_c.location * (bd.Sketch() + bd.Rectangle(height=(2*primary_radius_outer if secondary_override_width is None else secondary_override_width)+2*secondary_counterfit_clearance, width=2*primary_radius_outer+2*secondary_counterfit_clearance))
+        sketch_body_cross = mount_c_loc * (bd.Sketch() + bd.Rectangle(height=(2*primary_radius_outer if secondary_override_width is None else secondary_override_width)+2*secondary_counterfit_clearance, width=2*primary_radius_outer+2*secondary_counterfit_clearance))
         #sketch_body_cable = self.mount_c.location * (bd.Sketch() + bd.Circle(radius=7))
-        sketch_body_cable = self.mount_c.location * (bd.Sketch() + bd.Rectangle(width=13,height=4.5) + bd.Rectangle(width=4.5,height=13))
+        sketch_body_cable = mount_c_loc * _make_sketch_body_cable()
         #sketch_body_slots = self.mount_c.location * (bd.Sketch() + [bd.Location((0,0,0),(0,0,a*360/secondary_attach_slots)) * bd.Location((secondary_attach_span/2,0,0)) * bd.Circle(radius=secondary_screw_diameter/2 + secondary_screw_diameter_clearance * 0.5 * (-1 if secondary_attach_knobs else 1)) for a in range(secondary_attach_slots)]) # type: ignore
 
+        slots_xy = None
+        """ The positions of the slots in one octant, mirrored and swapped to all the other ones. """
         if secondary_force_430_knobs or isinstance(servo, XM430):
-            sketch_body_slots = self.mount_c.location * (bd.Sketch() + [bd.Location((xy[0], xy[1])) * bd.Circle(radius=secondary_screw_diameter/2 + secondary_screw_diameter_clearance * 0.5 * (-1 if secondary_attach_knobs else 1)) for xy in [(6,8),(-6,8),(6,-8),(-6,-8)]])
-            sketch_body_slots += self.mount_c.location * (bd.Sketch() + [bd.Location((xy[1], xy[0])) * bd.Circle(radius=secondary_screw_diameter/2 + secondary_screw_diameter_clearance * 0.5 * (-1 if secondary_attach_knobs else 1)) for xy in [(6,8),(-6,8),(6,-8),(-6,-8)]])
+            slots_xy = (6,8)
             #sketch_body_slots += self.mount_c.location * (bd.Sketch() + [bd.Location((0,0,0),(0,0,a*90+45)) * bd.Location((sqrt(8**2+6**2),0,0)) * bd.Circle(radius=secondary_screw_diameter/5 + secondary_screw_diameter_clearance * 0.5 * (-1 if secondary_attach_knobs else 1)) for a in range(4)])
         if isinstance(servo, XM540) and not secondary_force_430_knobs:
-            sketch_body_slots = self.mount_c.location * (bd.Sketch() + [bd.Location((xy[0], xy[1])) * bd.Circle(radius=secondary_screw_diameter/2 + secondary_screw_diameter_clearance * 0.5 * (-1 if secondary_attach_knobs else 1)) for xy in [(10,8),(-10,8),(10,-8),(-10,-8)]])
-            sketch_body_slots += self.mount_c.location * (bd.Sketch() + [bd.Location((xy[1], xy[0])) * bd.Circle(radius=secondary_screw_diameter/2 + secondary_screw_diameter_clearance * 0.5 * (-1 if secondary_attach_knobs else 1)) for xy in [(10,8),(-10,8),(10,-8),(-10,-8)]])
-        sketch_face_a = self.mount_a.location * bd.Location((0,0,-primary_span_clearance),(0,0,-90)) * sketch_face
-        sketch_face_b = self.mount_b.location * bd.Location((0,0,-primary_span_clearance),(0,0,90)) * sketch_face
+            slots_xy = (10,8)
+        if slots_xy is not None:
+            x, y = slots_xy
+            slot_radius = secondary_screw_diameter/2 + secondary_screw_diameter_clearance * 0.5 * (-1 if secondary_attach_knobs else 1)
+            # NOTE: All eight circles are fused at once.
+            sketch_body_slots = mount_c_loc * (bd.Sketch() + [bd.Location(xy) * bd.Circle(radius=slot_radius) for xy in ((x,y),(-x,y),(x,-y),(-x,-y),(y,x),(y,-x),(-y,x),(-y,-x))])
+        sketch_face_a = mount_a_loc * bd.Location((0,0,-primary_span_clearance),(0,0,-90)) * sketch_face
+        sketch_face_b = mount_b_loc * bd.Location((0,0,-primary_span_clearance),(0,0,90)) * sketch_face
 
         ziptie_span = 13 # primary_radius_outer * .4 * 2
 
+        screw_names = [sname for sname in servo.screw_definitions.keys() if sname.startswith(("ra", "b"))]
+        """ The rotor and bearing screws. """
+        screw_hulls = [servo.screw(which=sname, length_above=2.5).adjust(width__add=0.1, head_width__add=0.1, head_length=1000).body_hull for sname in screw_names]
+
         result = bd.extrude(sketch_body, amount=secondary_thickness) - \
                 bd.extrude(sketch_body_cross, amount=secondary_thickness/2) + \
                 bd.extrude(sketch_face_a, amount=-primary_thickness) + \
@@ -186,7 +212,7 @@ class BracketRotor (Thing):
                 bd.Location((ziptie_span/2,clearance*0.7)) * bd.Box(width=3, length=1.5, height=100) - \
                 bd.Location((-ziptie_span/2,clearance*0.7)) * bd.Box(width=3, length=1.5, height=100) - \
                 bd.Location((0,clearance*0.7)) * bd.Box(width=3, length=ziptie_span, height=primary_span+3) -\
-                [servo.screw(which=sname, length_above=2.5).adjust(width__add=0.1, head_width__add=0.1, head_length=1000).body_hull for sname in servo.screw_definitions.keys() if sname.startswith("ra") or sname.startswith("b")]
+                screw_hulls
                 #bd.extrude(sketch_cable_holder_a1, amount=-cable_holder_thickness_tip) + \
                 #bd.extrude(sketch_cable_holder_a2, amount=+cable_holder_thickness_tip)
                 #bd.extrude(bd.Location((0,0,0),(90,0,0)) * bd.Circle(radius=extrude_amount/2), amount=thickness/2, both=True) - \
@@ -281,12 +307,8 @@ class BracketRotorRotorBended (Thing):
         self.a = BracketRotorBended(servo_type=servo_type_a, clearance_total=distance_a)
         self.b = BracketRotorBended(servo_type=servo_type_b, clearance_total=distance_b).move(bd.Location((0,0,0), (0,0,90)))
 
-        result = bd.Sketch()
-        for a in (self.a, self.b):
-            for name, value in a.__dict__.items():
-                if isinstance(value, bd.Sketch):
-                    result += value
-        self.body = result
+        # NOTE: The sketches are collected first and fused at once. Only `self.a` contributes; `self.b` is a transform resolver whose own attributes never held any sketch.
+        self.body = bd.Sketch() + [value for value in self.a.__dict__.values() if isinstance(value, bd.Sketch)]
 
     def result(self) -> bd.Part:
         return self.body
@@ -304,7 +326,7 @@ class AssemblyBracketRotorRotor (Thing):
         self.bracket1 = MountPoint(bd.Location())
         Rigid(self.bracket1, bracket1.mount_c)
 
-        self.bracket2 = MountPoint(bd.Location(bd.Location((0,0,0), (180,0,90))))
+        self.bracket2 = MountPoint(bd.Location(MOUNTING_LOCATION))
         Rigid(self.bracket2, bracket2.mount_c)
 
         self.mount_rotor_1 = MountPoint(self.bracket1.mount_a.location)
@@ -0,0 +1,65 @@
+"""
+Tests that the cached debug flags follow every mutation of `DEBUG`.
+"""
+
+import unittest
+
+import build123things
+from build123things import DEBUG
+
+GETATTR = "Thing.__getattr__"
+SETATTR = "Thing.__setattr__"
+
+class TestDebugSet (unittest.TestCase):
+
+    def setUp(self):
+        DEBUG.clear()
+
+    def tearDown(self):
+        DEBUG.clear()
+
+    def assertFlags(self, getattr_on:bool, setattr_on:bool):
+        self.assertEqual(build123things._DEBUG_GETATTR, getattr_on)
+        self.assertEqual(build123things._DEBUG_SETATTR, setattr_on)
+
+    def test_add_discard_remove(self):
+        DEBUG.add(GETATTR)
+        self.assertFlags(True, False)
+        DEBUG.discard(GETATTR)
+        self.assertFlags(False, False)
+        DEBUG.add(SETATTR)
+        DEBUG.remove(SETATTR)
+        self.assertFlags(False, False)
+
+    def test_pop_clear(self):
+        DEBUG.add(GETATTR)
+        DEBUG.pop()
+        self.assertFlags(False, False)
+        DEBUG.update({GETATTR, SETATTR})
+        self.assertFlags(True, True)
+        DEBUG.clear()
+        self.assertFlags(False, False)
+
+    def test_updates(self):
+        DEBUG.update({GETATTR, SETATTR})
+        DEBUG.difference_update({GETATTR})
+        self.assertFlags(False, True)
+        DEBUG.intersection_update({GETATTR})
+        self.assertFlags(False, False)
+        DEBUG.symmetric_difference_update({GETATTR})
+        self.assertFlags(True, False)
+
+    def test_inplace_operators(self):
+        global DEBUG
+        DEBUG |= {GETATTR, SETATTR}
+        self.assertFlags(True, True)
+        DEBUG -= {GETATTR}
+        self.assertFlags(False, True)
+        DEBUG &= {GETATTR}
+        self.assertFlags(False, False)
+        DEBUG ^= {SETATTR}
+        self.assertFlags(False, True)
+        self.assertIs(DEBUG, build123things.DEBUG)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+"""
+Tests of the generic memoization.
+"""
+
+import unittest
+
+from build123things.misc import memoize, MEMOIZATION_PROFILED_CALLS, MEMOIZATION_STATS
+
+class TestMemoize (unittest.TestCase):
+
+    def test_cheap_function_stays_cached(self):
+        @memoize
+        def cheap(i):
+            return [i]
+        first = [cheap(i) for i in range(2 * MEMOIZATION_PROFILED_CALLS)]
+        for i, ret in enumerate(first):
+            self.assertIs(cheap(i), ret)
+        self.assertIs(cheap(0), cheap(0))
+
+    def test_argument_types(self):
+        @memoize
+        def type_name(x):
+            return type(x).__name__
+        self.assertEqual([type_name(1), type_name(1.0), type_name(True)], ["int", "float", "bool"])
+        self.assertEqual([type_name(x=1), type_name(x=1.0), type_name(x=True)], ["int", "float", "bool"])
+
+    def test_adaptive_bypasses_cheap_function(self):
+        def cheap(i):
+            return [i]
+        memoized = memoize(cheap, adaptive=True)
+        for i in range(MEMOIZATION_PROFILED_CALLS):
+            memoized(i)
+        self.assertEqual(MEMOIZATION_STATS[cheap][0], MEMOIZATION_PROFILED_CALLS)
+        self.assertIsNot(memoized(0), memoized(0))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Tests of the core Thing machinery: the instance cache, pickling and the cached properties.
+"""
+
+import gc
+import pickle
+import unittest
+import warnings
+import weakref
+
+import build123d as bd
+import numpy as np
+from build123things import Thing, _thing_cache, _mass_properties
+from build123things.materials import PETG
+
+class Spacer (Thing):
+    """ A minimal Thing with a positional and a defaulted parameter. """
+    def __init__(self, length:float, width:float = 2.0) -> None:
+        super().__init__(material=PETG())
+        self.body = bd.Box(length, width, 1, align=bd.Align.MIN)
+
+    def result(self) -> bd.Part:
+        return self.body
+
+class TestInstanceCache (unittest.TestCase):
+
+    def test_same_arguments(self):
+        self.assertIs(Spacer(20, 3), Spacer(20, 3))
+
+    def test_argument_types(self):
+        self.assertIsNot(Spacer(21.0, 3), Spacer(21, 3))
+        self.assertIsNot(Spacer(22, True), Spacer(22, 1))
+        self.assertIsInstance(Spacer(23.0, 3).p.length, float)
+        self.assertIsInstance(Spacer(23, 3).p.length, int)
+
+    def test_keyword_order(self):
+        self.assertIs(Spacer(length=24, width=3), Spacer(width=3, length=24))
+
+    def test_unused_thing_is_collected(self):
+        x = Spacer(25, 3)
+        ref = weakref.ref(x)
+        self.assertIn(x, Spacer._instance_cache.values())
+        del x
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertFalse(any(t.p.length == 25 for t in Spacer._instance_cache.values()))
+
+class TestCachedProperties (unittest.TestCase):
+
+    def test_equivalent_calls_share_entry(self):
+        x = Spacer(30, 3)
+        volume = x.volume_mm3()
+        self.assertEqual(x.volume_mm3(False), volume)
+        self.assertEqual(x.volume_mm3(recurse=False), volume)
+        self.assertAlmostEqual(x.volume(), volume * 1e-9)
+        x.mass()
+        self.assertEqual([k for k in _thing_cache(x) if "volume_mm3" in k], ["volume_mm3"])
+
+    def test_inertia_is_copied(self):
+        x = Spacer(31, 3)
+        inertia, cog = x.matrix_of_inertia()
+        expected = inertia.copy(), cog.copy()
+        inertia *= 1000
+        cog += 1
+        inertia, cog = x.matrix_of_inertia()
+        self.assertTrue((inertia == expected[0]).all())
+        self.assertTrue((cog == expected[1]).all())
+
+    def test_bounding_box_is_copied(self):
+        x = Spacer(32, 3)
+        bb = x.bounding_box()
+        bb.max.X = 100
+        self.assertAlmostEqual(x.bounding_box().max.X, 32)
+
+class TestMassProperties (unittest.TestCase):
+
+    def small_cube(self) -> np.ndarray:
+        """ A cube with a 1 mm edge, in meters, as 12 outward oriented triangles. """
+        v = np.array([[x, y, z] for x in (0, 1e-3) for y in (0, 1e-3) for z in (0, 1e-3)])
+        faces = ((0,1,3),(0,3,2),(4,6,7),(4,7,5),(0,4,5),(0,5,1),(2,3,7),(2,7,6),(0,2,6),(0,6,4),(1,5,7),(1,7,3))
+        return v[np.array(faces)]
+
+    def test_closed_mesh(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            volume, _, _ = _mass_properties(self.small_cube())
+        self.assertAlmostEqual(volume / 1e-9, 1)
+
+    def test_open_small_mesh_warns(self):
+        with self.assertWarns(UserWarning):
+            _mass_properties(self.small_cube()[1:])
+
+class TestPickle (unittest.TestCase):
+
+    def test_positional(self):
+        x = Spacer(10, 3)
+        self.assertIs(pickle.loads(pickle.dumps(x)), x)
+
+    def test_keyword(self):
+        x = Spacer(length=11, width=3)
+        self.assertIs(pickle.loads(pickle.dumps(x)), x)
+
+    def test_default(self):
+        x = Spacer(12)
+        self.assertIs(pickle.loads(pickle.dumps(x)), x)
+
+if __name__ == "__main__":
+    unittest.main()